@@ -1,6 +1,8 @@
 # INTERFACE MAIN CONSTANTS
 BTN_DEFAULT_CUR = 'hand2'
 BTN_PLUS_CUR = 'plus'
+BUSY_CURSOR = 'watch'
+BUSY_MODE = 'indeterminate'
 CHILD_WINDOW_HEIGHT = 400
 CHILD_WINDOW_WIDTH = 600
 COMBOBOX_SELECTED = '<<ComboboxSelected>>'
@@ -20,6 +22,7 @@ ADD_ROW_BUTTON_BG = 'green'
 ADD_ROW_BUTTON_FG = 'white'
 DANGER_BUTTON_BG = 'red'
 DANGER_BUTTON_FG = 'white'
+ERROR_ROW_BG = '#f4cccc'
 MAIN_THEME = 'winnative'
 
 
@@ -32,9 +35,11 @@ CHANGE_DISH_MENU_LABEL = 'Изменить существующий вид бл
 DELETE_DISH_MENU_LABEL = 'Удалить существующий вид блюда'
 DELETE_TYPE_MENU_LABEL = 'Удалить существующий вид мяса'
 EDIT_MENU_LABEL = 'Внести изменения в базу'
+EDIT_RECIPE_MENU_LABEL = 'Изменить рецепт блюда'
 FREEZER_TO_FRIDGE_MENU_LABEL = 'Перенести из морозильника'
 FRIDGE_TO_FREEZER_MENU_LABEL = 'Перенести из холодильника'
 SETTINGS_MENU_LABEL = 'Настройки'
+THAW_PLAN_MENU_LABEL = 'Спланировать разморозку'
 
 # FRAMES TEXT
 ADD_BUTTON_TEXT = 'Добавить'
@@ -51,18 +56,32 @@ DELETE_DISH_BUTTON_TEXT = 'Удалить вид блюда'
 DELETE_TYPE_BUTTON_TEXT = 'Удалить вид мяса'
 DISHES_FRAME_ENTRY_TEXT = 'Введите название блюда'
 DISHES_FRAME_TEXT = 'Виды блюд'
+CAPACITY_FRAME_TEXT = 'Можно приготовить'
 ERROR_TITLE = 'Ошибка!'
+FORECAST_FRAME_TEXT = 'Прогноз'
 FREEZER_FRAME_TEXT = 'В морозильнике'
 FRIDGE_FRAME_TEXT = 'В холодильнике'
-MOVE_FRAME_ENTRY_TEXT = 'Введите количество для переноса (гр.)'
-MOVE_FRAME_LABEL_TEXT = 'Выберите переносимый вид мяса'
 MOVE_BUTTON_TEXT = 'Перенести'
-MOVE_FREEZER_LABEL_TEXT = 'Сейчас в морозильнике {type_freezer} гр.'
-MOVE_FRIDGE_LABEL_TEXT = 'Сейчас в холодильнике {type_fridge} гр.'
+RECIPE_AMOUNT_ERROR = ('Количество на порцию должно быть целым числом '
+                       'больше 0')
+RECIPE_AMOUNT_LABEL = 'Количество на одну порцию (гр.)'
 REPORT_DISH_LABEL = 'Вид блюда'
 REPORT_DISH_AMOUNT_LABEL = 'Количество порций'
+REPORT_ERROR_LABEL = 'Ошибка'
+REPORT_PASTE_BUTTON_TEXT = 'Вставить из буфера'
+REPORT_PORTIONS_ERROR = 'Количество порций должно быть целым числом больше 0'
+REPORT_UNKNOWN_DISH_ERROR = 'Такого блюда нет в базе'
+SEARCH_LABEL_TEXT = 'Поиск: '
+SAVE_RECIPE_BUTTON_TEXT = 'Сохранить рецепт'
 SEND_REPORT_BUTTON_TEXT = 'Отправить отчёт'
 TOTAL_FRAME_TEXT = 'Всё мясо'
+TRANSFER_AMOUNT_ERROR = 'Количество должно быть целым числом больше 0'
+TRANSFER_AMOUNT_LABEL = 'Количество (гр.)'
+TRANSFER_AVAILABLE_LABEL = 'Доступно (гр.)'
+TRANSFER_SHORTAGE_ERROR = 'Недостаточно мяса, доступно {available} гр.'
+TRANSFER_STOCK_LABEL_TEXT = 'Сейчас {stock} гр.'
+TRANSFER_TYPE_LABEL = 'Вид мяса'
+TRANSFER_UNKNOWN_TYPE_ERROR = 'Такого вида мяса нет в базе'
 TYPES_FRAME_ENTRY_TEXT = 'Введите название вида'
 TYPES_FRAME_TEXT = 'Виды мяса'
 
@@ -76,6 +95,8 @@ DELETE_TYPE_MSGBOX_MESSAGE = ('ВНИМАНИЕ!\nПри удалении дан
                               'ДАННОГО ВИДА МЯСА ТОЖЕ БУДЕТ УДАЛЕНА!\n'
                               'Уверены, что хотите удалить данный вид мяса?')
 DELETE_TYPE_MSGBOX_TITLE = 'Удалить вид мяса?'
+REPORT_INVALID_LINES_MESSAGE = ('Строк с ошибками: {count}.\n'
+                                'Исправьте их или удалите (клавиша Delete).')
 REPORT_MSGBOX_EMPTY_TITLE = 'Никаких изменений не внесено!'
 REPORT_MSGBOX_EMPTY_MESSAGE = ('Все строки пустые или во всех не выбрано '
                                'одно из полей (количество/блюдо)')
@@ -84,26 +105,50 @@ REPORT_MSGBOX_TITLE = 'Внести отчёт?'
 REPORT_MSGBOX_SUCCESS_TITLE = 'Удачно!'
 REPORT_MSGBOX_SUCCESS_MESSAGE = ('Мяса вида "{name}" - использовано {amount} '
                                  'гр. ({amount_kg} кг.)\n')
+THAW_PLAN_DAYS_TEXT = 'На сколько дней вперёд разморозить мясо?'
+THAW_PLAN_EMPTY_MESSAGE = ('По прогнозу мяса в холодильнике хватит, '
+                           'переносить ничего не нужно')
+TRANSFER_FAILED_MESSAGE = ('Ничего не перенесено, строк с ошибками: {count}.\n'
+                           'Исправьте их или удалите (клавиша Delete).')
 
 # TREES CONSTANTS
 AMOUNT = 'amount'
 AMOUNT_KG = 'amount_kg'
 COUNT_PER_ONE = 'count_per_one'
+FAIR_PORTIONS = 'fair_portions'
+MAX_PORTIONS = 'max_portions'
+DAILY_USAGE = 'daily_usage'
+DAYS_OF_COVER = 'days_of_cover'
 NAME = 'name'
+REORDER_POINT = 'reorder_point'
+TODAY_USAGE = 'today_usage'
+LIMITING_TYPE = 'limiting_type'
+RECIPE = 'recipe'
 TYPE_NAME = 'type_name'
 
 DATA_COLUMNS_LABELS = {
     AMOUNT: 'Количество (гр.)',
     AMOUNT_KG: 'Количество (кг.)',
     COUNT_PER_ONE: 'Количество на одну порцию (гр.)',
+    DAILY_USAGE: 'Расход в день (гр.)',
+    DAYS_OF_COVER: 'Хватит на (дней)',
+    FAIR_PORTIONS: 'Порций с учётом других блюд',
+    LIMITING_TYPE: 'Меньше всего хватает',
+    MAX_PORTIONS: 'Максимум порций',
     NAME: 'Название',
+    RECIPE: 'Рецепт (гр. на порцию)',
+    REORDER_POINT: 'Точка заказа (гр.)',
+    TODAY_USAGE: 'Прогноз на сегодня (гр.)',
     TYPE_NAME: 'Используемое сырье'
 }
 
 LIST_COLUMNS = {
     'types': (NAME, ),
-    'dishes': (NAME, TYPE_NAME, COUNT_PER_ONE),
-    'meat': (NAME, AMOUNT, AMOUNT_KG)
+    'dishes': (NAME, TYPE_NAME, COUNT_PER_ONE, RECIPE),
+    'meat': (NAME, AMOUNT, AMOUNT_KG),
+    'forecast': (NAME, DAILY_USAGE, TODAY_USAGE, DAYS_OF_COVER,
+                 REORDER_POINT),
+    'capacity': (NAME, LIMITING_TYPE, MAX_PORTIONS, FAIR_PORTIONS)
 }
 
 HEADINGS = 'headings'
@@ -113,25 +158,52 @@ EDIT_MENU = {
     ADD_REPORT_MENU_LABEL: '_open_report_window',
     ADD_MEAT_MENU_LABEL: '_open_amount_adding_window',
     FREEZER_TO_FRIDGE_MENU_LABEL: '_open_freezer_to_fridge_window',
-    FRIDGE_TO_FREEZER_MENU_LABEL: '_open_fridge_to_freezer_window'
+    FRIDGE_TO_FREEZER_MENU_LABEL: '_open_fridge_to_freezer_window',
+    THAW_PLAN_MENU_LABEL: '_open_thaw_plan_window'
 }
 
 MAIN_FRAMES = {
     TOTAL_FRAME_TEXT: 'total',
+    FORECAST_FRAME_TEXT: 'forecast',
     FRIDGE_FRAME_TEXT: 'fridge',
     FREEZER_FRAME_TEXT: 'freezer',
     TYPES_FRAME_TEXT: 'types',
-    DISHES_FRAME_TEXT: 'dishes'
+    DISHES_FRAME_TEXT: 'dishes',
+    CAPACITY_FRAME_TEXT: 'capacity'
 }
 
 SETTINGS_MENU = {
     ADD_TYPE_MENU_LABEL: '_open_type_adding_window',
     ADD_DISH_MENU_LABEL: '_open_dish_adding_window',
     CHANGE_DISH_MENU_LABEL: '_open_dish_change_window',
+    EDIT_RECIPE_MENU_LABEL: '_open_recipe_window',
     DELETE_DISH_MENU_LABEL: '_open_delete_dish_window',
     DELETE_TYPE_MENU_LABEL: '_open_delete_type_window'
 }
 
 # INTEGER CONSTANTS
+DB_POLL_INTERVAL = 50
+PAGE_SIZE = 100
+SEARCH_DELAY = 300
+TREE_BUFFER_ROWS = 50
+TYPEAHEAD_LIMIT = 100
+TREE_ROW_HEIGHT = 20
 DISH_MAX_AMOUNT = 500
 MAX_AMOUNT = 999999
+THAW_PLAN_DAYS = 2
+THAW_PLAN_MAX_DAYS = 28
+
+# IMPORT CONSTANTS
+IMPORT_AMOUNT_ERROR = 'Количество должно быть целым числом больше 0'
+IMPORT_DEFAULT_CHUNK_SIZE = 500
+IMPORT_DESCRIPTION = ('Загрузка отчётов, поставок и переносов мяса '
+                      'из CSV/JSONL файлов')
+IMPORT_FORMAT_ERROR = 'Не удалось определить формат файла {path}'
+IMPORT_FORMATS = ('csv', 'jsonl')
+IMPORT_KINDS = ('report', 'delivery', 'freezer_to_fridge',
+                'fridge_to_freezer')
+IMPORT_NAME_ERROR = 'Название должно быть строкой'
+IMPORT_NOT_A_NUMBER_ERROR = 'Это не число'
+IMPORT_ROW_ERROR = '{path}:{line}: {message}'
+IMPORT_SUMMARY = 'Загружено строк: {done}, с ошибками: {failed}'
+IMPORT_UNKNOWN_KIND_ERROR = 'Неизвестный вид строки "{kind}"'
@@ -0,0 +1,49 @@
+from tkinter import Misc, Toplevel
+
+import constants
+
+
+class DialogManager:
+    def __init__(self,
+                 root: Misc,
+                 width: int,
+                 height: int,
+                 x: int,
+                 y: int) -> None:
+        self.root = root
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self._dialogs = {}
+
+    def _create(self, title: str) -> Toplevel:
+        window = Toplevel(self.root)
+        window.title(title)
+        window.minsize(self.width, self.height)
+        window.geometry(f'{self.width}x{self.height}+{self.x}+{self.y}')
+        window.protocol(constants.CLOSE_WINDOW_PROTOCOL, window.withdraw)
+
+        return window
+
+    def open(self, key: str, title: str, build: callable, *args) -> Toplevel:
+        if key in self._dialogs:
+            window, reset = self._dialogs[key]
+            window.title(title)
+            window.deiconify()
+        else:
+            window = self._create(title)
+            reset = build(window)
+            self._dialogs[key] = (window, reset)
+
+        if reset:
+            reset(*args)
+
+        window.lift()
+        window.focus_force()
+
+        return window
+
+    def close(self, window: Toplevel) -> None:
+        window.withdraw()
+        self.root.focus_force()
@@ -0,0 +1,88 @@
+import queue
+import threading
+from tkinter import Misc
+
+
+class DBExecutor:
+    def __init__(self,
+                 root: Misc,
+                 session_factory: callable,
+                 poll_interval: int = 50,
+                 on_busy: callable = None) -> None:
+        self.root = root
+        self.poll_interval = poll_interval
+        self.on_busy = on_busy
+        self.pending = 0
+
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._work,
+                                        args=(session_factory, ),
+                                        daemon=True)
+        self._thread.start()
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def submit(self,
+               func: callable,
+               *args,
+               callback: callable = None,
+               errback: callable = None) -> None:
+        self.pending += 1
+
+        if self.pending == 1 and self.on_busy:
+            self.on_busy(True)
+
+        self._tasks.put((func, args, callback, errback))
+
+    def shutdown(self) -> None:
+        self.root.after_cancel(self._poll_id)
+        self._tasks.put(None)
+        self._thread.join()
+
+    def _work(self, session_factory: callable) -> None:
+        session = session_factory()
+
+        try:
+            while (task := self._tasks.get()) is not None:
+                func, args, callback, errback = task
+
+                try:
+                    result = func(session, *args)
+
+                except Exception as error:
+                    session.rollback()
+                    self._results.put((errback, error, True))
+
+                else:
+                    self._results.put((callback, result, False))
+
+                finally:
+                    # end the transaction so the next task reads fresh data
+                    session.close()
+
+        finally:
+            session.close()
+
+    def _poll(self) -> None:
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+        while True:
+            try:
+                callback, value, failed = self._results.get_nowait()
+
+            except queue.Empty:
+
+                break
+
+            self.pending -= 1
+
+            if self.pending == 0 and self.on_busy:
+                self.on_busy(False)
+
+            if callback:
+                callback(value)
+
+            elif failed:
+                self.root.report_callback_exception(type(value),
+                                                    value,
+                                                    value.__traceback__)
@@ -0,0 +1,10 @@
+import constants
+from core.report import ReportGrid
+
+
+class RecipeGrid(ReportGrid):
+    headings = (constants.TRANSFER_TYPE_LABEL,
+                constants.RECIPE_AMOUNT_LABEL,
+                constants.REPORT_ERROR_LABEL)
+    unknown_error = constants.TRANSFER_UNKNOWN_TYPE_ERROR
+    amount_error = constants.RECIPE_AMOUNT_ERROR
@@ -0,0 +1,195 @@
+from collections import defaultdict
+from tkinter import Button, TclError, ttk
+from tkinter.constants import BOTH, END, LEFT, RIGHT, X, Y
+
+import constants
+from core.search import PrefixIndex, TypeaheadCombobox
+
+ERROR_TAG = 'error'
+REPORT_COLUMNS = ('dish', 'portions', 'error')
+REPORT_SEPARATORS = ('\t', ';')
+
+
+def parse_report_text(text: str) -> list[tuple[str, str]]:
+    lines = []
+
+    for line in text.splitlines():
+        if not line.strip():
+
+            continue
+
+        for separator in REPORT_SEPARATORS:
+            dish, found, portions = line.rpartition(separator)
+
+            if found:
+
+                break
+
+        else:
+            dish, portions = line, ''
+
+        lines.append((dish.strip(), portions.strip()))
+
+    return lines
+
+
+def validate_report_lines(
+        lines,
+        dishes: PrefixIndex,
+        unknown_error: str = constants.REPORT_UNKNOWN_DISH_ERROR,
+        amount_error: str = constants.REPORT_PORTIONS_ERROR
+) -> list[str | None]:
+    errors = []
+
+    for dish, portions in lines:
+        if dish not in dishes:
+            errors.append(unknown_error)
+
+        elif (not (portions.isascii() and portions.isdigit())
+              or not int(portions)):
+            errors.append(amount_error)
+
+        else:
+            errors.append(None)
+
+    return errors
+
+
+class ReportGrid(ttk.Frame):
+    headings = (constants.REPORT_DISH_LABEL,
+                constants.REPORT_DISH_AMOUNT_LABEL,
+                constants.REPORT_ERROR_LABEL)
+    unknown_error = constants.REPORT_UNKNOWN_DISH_ERROR
+    amount_error = constants.REPORT_PORTIONS_ERROR
+
+    def __init__(self,
+                 parent,
+                 index: PrefixIndex,
+                 limit: int = None,
+                 **kw) -> None:
+        ttk.Frame.__init__(self, parent, **kw)
+
+        self.index = index
+        self.lines = {}
+
+        # single line entry
+        entry_bar = ttk.Frame(self)
+        self.dish_combobox = TypeaheadCombobox(entry_bar, index, limit=limit)
+        self.dish_combobox.pack(side=LEFT,
+                                fill=X,
+                                expand=True,
+                                padx=constants.DEFAULT_PADX)
+        self.portions_spinbox = ttk.Spinbox(entry_bar,
+                                            from_=1,
+                                            to=500,
+                                            increment=1)
+        self.portions_spinbox.pack(side=LEFT, padx=constants.DEFAULT_PADX)
+        Button(entry_bar,
+               text=constants.ADD_ROW_REPORT_BUTTON_TEXT,
+               command=self.add_entry_line,
+               cursor=constants.BTN_PLUS_CUR,
+               bg=constants.ADD_ROW_BUTTON_BG,
+               fg=constants.ADD_ROW_BUTTON_FG).pack(side=LEFT)
+        ttk.Button(entry_bar,
+                   text=constants.REPORT_PASTE_BUTTON_TEXT,
+                   cursor=constants.BTN_DEFAULT_CUR,
+                   command=self.paste).pack(side=LEFT,
+                                            padx=constants.DEFAULT_PADX)
+        entry_bar.pack(fill=X, pady=constants.DEFAULT_PADY)
+
+        # lines
+        scrollbar = ttk.Scrollbar(self, orient='vertical')
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.tree = ttk.Treeview(self,
+                                 columns=REPORT_COLUMNS,
+                                 show=constants.HEADINGS,
+                                 yscrollcommand=scrollbar.set)
+        scrollbar.config(command=self.tree.yview)
+        for i, heading in enumerate(self.headings):
+            self.tree.heading(i, text=heading)
+
+        self.tree.tag_configure(ERROR_TAG,
+                                background=constants.ERROR_ROW_BG)
+        self.tree.pack(fill=BOTH, expand=True)
+
+        for sequence in ('<<Paste>>', '<Control-v>', '<Control-V>'):
+            self.tree.bind(sequence, self.paste)
+
+        self.tree.bind('<Delete>', self.delete_selected)
+        self.dish_combobox.bind('<Return>', self.add_entry_line)
+        self.portions_spinbox.bind('<Return>', self.add_entry_line)
+
+    def add_lines(self, lines) -> None:
+        for dish, portions in lines:
+            iid = self.tree.insert('', END, values=(dish, portions, ''))
+            self.lines[iid] = (dish, portions)
+
+        self.validate()
+
+    def add_entry_line(self, event=None):
+        dish = self.dish_combobox.get().strip()
+        portions = self.portions_spinbox.get().strip()
+
+        if dish:
+            self.add_lines([(dish, portions)])
+            self.dish_combobox.set('')
+            self.portions_spinbox.delete(0, END)
+            self.dish_combobox.focus()
+
+        return 'break'
+
+    def paste(self, event=None):
+        try:
+            text = self.clipboard_get()
+
+        except TclError:
+
+            return 'break'
+
+        self.add_lines(parse_report_text(text))
+        self.tree.focus_set()
+
+        return 'break'
+
+    def delete_selected(self, event=None):
+        for iid in self.tree.selection():
+            self.tree.delete(iid)
+            del self.lines[iid]
+
+        self.validate()
+
+        return 'break'
+
+    def reset(self, index: PrefixIndex, lines=()) -> None:
+        self.tree.delete(*self.lines)
+        self.lines = {}
+        self.index = index
+        self.dish_combobox.set('')
+        self.dish_combobox.set_index(index)
+        self.portions_spinbox.delete(0, END)
+        self.add_lines(lines)
+
+    def validate(self, index: PrefixIndex = None) -> int:
+        if index is not None:
+            self.index = index
+
+        errors = validate_report_lines(self.lines.values(),
+                                       self.index,
+                                       self.unknown_error,
+                                       self.amount_error)
+
+        for (iid, (dish, portions)), error in zip(self.lines.items(),
+                                                  errors):
+            self.tree.item(iid,
+                           values=(dish, portions, error or ''),
+                           tags=(ERROR_TAG, ) if error else ())
+
+        return sum(1 for error in errors if error)
+
+    def get_data(self) -> dict[str, int]:
+        data = defaultdict(int)
+
+        for dish, portions in self.lines.values():
+            data[dish] += int(portions)
+
+        return data
@@ -0,0 +1,67 @@
+from bisect import bisect_left
+from tkinter import ttk
+from typing import NamedTuple
+
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
+NAVIGATION_KEYS = frozenset(('Up', 'Down', 'Left', 'Right', 'Return',
+                             'Escape', 'Tab', 'Home', 'End'))
+
+
+class PrefixIndex:
+    def __init__(self, names=()) -> None:
+        entries = sorted((name.casefold(), name) for name in names)
+
+        self.keys = [key for key, _ in entries]
+        self.names = [name for _, name in entries]
+        self.exact = frozenset(self.names)
+
+    def __contains__(self, name: str) -> bool:
+
+        return name in self.exact
+
+    def __len__(self) -> int:
+
+        return len(self.names)
+
+    def search(self, prefix: str, limit: int = None) -> list[str]:
+        key = prefix.casefold()
+        start = bisect_left(self.keys, key)
+        end = bisect_left(self.keys, key + PREFIX_UPPER_BOUND, lo=start)
+
+        if limit is not None:
+            end = min(end, start + limit)
+
+        return self.names[start:end]
+
+
+class NamesSnapshot(NamedTuple):
+    generation: int
+    index: PrefixIndex
+
+
+class TypeaheadCombobox(ttk.Combobox):
+    def __init__(self,
+                 parent,
+                 index: PrefixIndex,
+                 limit: int = None,
+                 **kw) -> None:
+        ttk.Combobox.__init__(self, parent, **kw)
+
+        self.limit = limit
+        self.set_index(index)
+        self.bind('<KeyRelease>', self._on_key_release)
+
+    def set_index(self, index: PrefixIndex) -> None:
+        self.index = index
+        self['values'] = index.search(self.get(), self.limit)
+
+    def _on_key_release(self, event) -> None:
+        if event.keysym in NAVIGATION_KEYS:
+
+            return
+
+        value = self.get()
+        self['values'] = self.index.search(value, self.limit)
+
+        if value in self.index:
+            self.event_generate('<<ComboboxSelected>>')
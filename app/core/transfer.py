@@ -0,0 +1,169 @@
+from collections import defaultdict
+from tkinter import Button, ttk
+from tkinter.constants import BOTH, END, LEFT, RIGHT, X, Y
+
+import constants
+from core.report import ERROR_TAG
+from core.search import PrefixIndex, TypeaheadCombobox
+
+TRANSFER_COLUMNS = ('type', 'amount', 'available', 'error')
+
+
+def validate_transfer_lines(lines,
+                            types: PrefixIndex,
+                            get_stock: callable) -> list[str | None]:
+    errors = []
+    requested = defaultdict(int)
+
+    for name, amount in lines:
+        if name not in types:
+            errors.append(constants.TRANSFER_UNKNOWN_TYPE_ERROR)
+
+            continue
+
+        if not (amount.isascii() and amount.isdigit()) or not int(amount):
+            errors.append(constants.TRANSFER_AMOUNT_ERROR)
+
+            continue
+
+        requested[name] += int(amount)
+        available = get_stock(name) or 0
+
+        if requested[name] > available:
+            errors.append(constants.TRANSFER_SHORTAGE_ERROR.format(
+                available=available))
+        else:
+            errors.append(None)
+
+    return errors
+
+
+class TransferGrid(ttk.Frame):
+    def __init__(self,
+                 parent,
+                 index: PrefixIndex,
+                 get_stock: callable,
+                 limit: int = None,
+                 **kw) -> None:
+        ttk.Frame.__init__(self, parent, **kw)
+
+        self.index = index
+        self.get_stock = get_stock
+        self.lines = {}
+
+        # single line entry
+        entry_bar = ttk.Frame(self)
+        self.type_combobox = TypeaheadCombobox(entry_bar, index, limit=limit)
+        self.type_combobox.pack(side=LEFT,
+                                fill=X,
+                                expand=True,
+                                padx=constants.DEFAULT_PADX)
+        self.amount_spinbox = ttk.Spinbox(entry_bar,
+                                          from_=1,
+                                          to=constants.MAX_AMOUNT,
+                                          increment=1)
+        self.amount_spinbox.pack(side=LEFT, padx=constants.DEFAULT_PADX)
+        self.stock_label = ttk.Label(entry_bar)
+        self.stock_label.pack(side=LEFT, padx=constants.DEFAULT_PADX)
+        Button(entry_bar,
+               text=constants.ADD_ROW_REPORT_BUTTON_TEXT,
+               command=self.add_entry_line,
+               cursor=constants.BTN_PLUS_CUR,
+               bg=constants.ADD_ROW_BUTTON_BG,
+               fg=constants.ADD_ROW_BUTTON_FG).pack(side=LEFT)
+        entry_bar.pack(fill=X, pady=constants.DEFAULT_PADY)
+
+        # lines
+        scrollbar = ttk.Scrollbar(self, orient='vertical')
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.tree = ttk.Treeview(self,
+                                 columns=TRANSFER_COLUMNS,
+                                 show=constants.HEADINGS,
+                                 yscrollcommand=scrollbar.set)
+        scrollbar.config(command=self.tree.yview)
+        self.tree.heading(0, text=constants.TRANSFER_TYPE_LABEL)
+        self.tree.heading(1, text=constants.TRANSFER_AMOUNT_LABEL)
+        self.tree.heading(2, text=constants.TRANSFER_AVAILABLE_LABEL)
+        self.tree.heading(3, text=constants.REPORT_ERROR_LABEL)
+        self.tree.tag_configure(ERROR_TAG,
+                                background=constants.ERROR_ROW_BG)
+        self.tree.pack(fill=BOTH, expand=True)
+
+        self.tree.bind('<Delete>', self.delete_selected)
+        self.type_combobox.bind(constants.COMBOBOX_SELECTED,
+                                self._show_stock)
+        self.type_combobox.bind('<Return>', self.add_entry_line)
+        self.amount_spinbox.bind('<Return>', self.add_entry_line)
+
+    def _show_stock(self, event=None) -> None:
+        stock = self.get_stock(self.type_combobox.get())
+        self.stock_label.config(
+            text='' if stock is None
+            else constants.TRANSFER_STOCK_LABEL_TEXT.format(stock=stock))
+
+    def add_lines(self, lines) -> None:
+        for name, amount in lines:
+            iid = self.tree.insert('', END, values=(name, amount, '', ''))
+            self.lines[iid] = (name, amount)
+
+        self.validate()
+
+    def add_entry_line(self, event=None):
+        name = self.type_combobox.get().strip()
+        amount = self.amount_spinbox.get().strip()
+
+        if name:
+            self.add_lines([(name, amount)])
+            self.type_combobox.set('')
+            self.amount_spinbox.delete(0, END)
+            self.stock_label.config(text='')
+            self.type_combobox.focus()
+
+        return 'break'
+
+    def delete_selected(self, event=None):
+        for iid in self.tree.selection():
+            self.tree.delete(iid)
+            del self.lines[iid]
+
+        self.validate()
+
+        return 'break'
+
+    def reset(self, index: PrefixIndex, lines=()) -> None:
+        self.tree.delete(*self.lines)
+        self.lines = {}
+        self.index = index
+        self.type_combobox.set('')
+        self.type_combobox.set_index(index)
+        self.amount_spinbox.delete(0, END)
+        self.stock_label.config(text='')
+        self.add_lines(lines)
+
+    def _show_errors(self, errors) -> int:
+        for (iid, (name, amount)), error in zip(self.lines.items(), errors):
+            self.tree.item(iid,
+                           values=(name,
+                                   amount,
+                                   self.get_stock(name) or 0,
+                                   error or ''),
+                           tags=(ERROR_TAG, ) if error else ())
+
+        return sum(1 for error in errors if error)
+
+    def validate(self, index: PrefixIndex = None) -> int:
+        if index is not None:
+            self.index = index
+
+        return self._show_errors(validate_transfer_lines(self.lines.values(),
+                                                         self.index,
+                                                         self.get_stock))
+
+    def show_results(self, results) -> int:
+
+        return self._show_errors([result.error for result in results])
+
+    def get_lines(self) -> list[dict]:
+
+        return [{'name': name, 'amount': amount}
+                for name, amount in self.lines.values()]
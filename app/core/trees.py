@@ -0,0 +1,199 @@
+from operator import itemgetter
+from tkinter import ttk
+
+
+class TreeModel:
+    def __init__(self, tree: ttk.Treeview, key: callable = itemgetter(0)):
+        self.tree = tree
+        self.key = key
+        self.rows = {}
+
+    def sync(self, data) -> None:
+        rows = {str(self.key(row)): tuple(row) for row in data}
+
+        for iid in self.rows.keys() - rows.keys():
+            self.tree.delete(iid)
+
+        reorder = ([iid for iid in self.rows if iid in rows]
+                   != [iid for iid in rows if iid in self.rows])
+
+        for index, (iid, values) in enumerate(rows.items()):
+            if iid not in self.rows:
+                self.tree.insert('', index, iid=iid, values=values)
+
+                continue
+
+            if self.rows[iid] != values:
+                self.tree.item(iid, values=values)
+
+            if reorder:
+                self.tree.move(iid, '', index)
+
+        self.rows = rows
+
+
+class VirtualTree(ttk.Frame):
+    def __init__(self,
+                 parent,
+                 columns: tuple[str],
+                 buffer: int = 50,
+                 row_height: int = 20,
+                 format_row: callable = None,
+                 on_end_reached: callable = None,
+                 **kw) -> None:
+        ttk.Frame.__init__(self, parent)
+
+        self.buffer = buffer
+        self.row_height = row_height
+        self.format_row = format_row
+        self.on_end_reached = on_end_reached
+        self.rows = []
+        self.first = 0
+        self.window = (0, 0)
+
+        self.scrollbar = ttk.Scrollbar(self,
+                                       orient='vertical',
+                                       command=self._on_scroll)
+        self.scrollbar.pack(fill='y', side='right', expand=False)
+        self.tree = ttk.Treeview(self,
+                                 columns=columns,
+                                 yscrollcommand=self._on_yview,
+                                 **kw)
+        self.tree.pack(fill='both', side='left', expand=True)
+        self.model = TreeModel(self.tree)
+
+        self.tree.bind('<Configure>', lambda event: self._render())
+
+        # X11 reports the wheel as buttons 4/5 instead of <MouseWheel>
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_mousewheel)
+
+    def set_rows(self, rows) -> None:
+        self.rows = list(rows)
+        self._render(force=True)
+
+    def append_rows(self, rows) -> None:
+        self.rows.extend(rows)
+        self._render(force=True)
+
+    def _visible(self) -> int:
+
+        return max(1, self.tree.winfo_height() // self.row_height)
+
+    def _render(self, force: bool = False, align: bool = True) -> None:
+        total = len(self.rows)
+        visible = self._visible()
+        # the Treeview clamps the last page itself and reports it back
+        # through yscrollcommand, so only keep first inside the rows
+        self.first = max(0, min(self.first, total - 1))
+        start, end = self.window
+
+        if force or self.first < start or min(total,
+                                              self.first + visible) > end:
+            start = max(0, self.first - self.buffer)
+            end = min(total, self.first + visible + self.buffer)
+            self.window = (start, end)
+            align = True
+
+            rows = self.rows[start:end]
+            self.model.sync(map(self.format_row, rows)
+                            if self.format_row else rows)
+
+        if align and end > start:
+            self.tree.yview_moveto((self.first - start) / (end - start))
+
+        if total:
+            self.scrollbar.set(self.first / total,
+                               min(1, (self.first + visible) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+        if self.on_end_reached and self.first + visible >= total:
+            self.on_end_reached()
+
+    def _scroll_to(self, first: int) -> None:
+        self.first = first
+        self._render()
+
+    def _on_scroll(self, action, value, unit=None) -> None:
+        if action == 'moveto':
+            self._scroll_to(int(float(value) * len(self.rows)))
+
+        elif action == 'scroll':
+            step = self._visible() if unit == 'pages' else 1
+            self._scroll_to(self.first + int(value) * step)
+
+    def _on_yview(self, low: str, high: str) -> None:
+        # keyboard navigation and drag-selection move the native view
+        # inside the materialized slice; follow it so the slice moves too
+        start, end = self.window
+        first = start + round(float(low) * (end - start))
+
+        if first != self.first:
+            self.first = first
+            self._render(align=False)
+
+    def _on_mousewheel(self, event):
+        if event.num in (4, 5):
+            steps = 1 if event.num == 4 else -1
+        else:
+            steps = int(event.delta / 120)
+
+        self._scroll_to(self.first - steps * 3)
+
+        return 'break'
+
+
+class KeysetPager:
+    def __init__(self,
+                 view: VirtualTree,
+                 fetch: callable,
+                 page_size: int = 100) -> None:
+        self.view = view
+        self.fetch = fetch
+        self.page_size = page_size
+        self.search = None
+        self.loading = False
+        self.exhausted = True
+        self.generation = 0
+
+    def reset(self, search: str | None) -> None:
+        self.search = search
+        self.generation += 1
+        self.exhausted = False
+        self._request(None)
+        self.view.on_end_reached = self.load_more
+
+    def detach(self) -> None:
+        self.generation += 1
+        self.loading = False
+        self.view.on_end_reached = None
+
+    def load_more(self) -> None:
+        if self.loading or self.exhausted:
+
+            return
+
+        self._request(self.view.rows[-1][0] if self.view.rows else None)
+
+    def _request(self, after: str | None) -> None:
+        generation = self.generation
+        self.loading = True
+
+        self.fetch(after,
+                   self.page_size,
+                   self.search,
+                   lambda rows: self._on_loaded(generation, after, rows))
+
+    def _on_loaded(self, generation: int, after: str | None, rows) -> None:
+        if generation != self.generation:
+
+            return
+
+        self.loading = False
+        self.exhausted = len(rows) < self.page_size
+
+        if after is None:
+            self.view.set_rows(rows)
+        else:
+            self.view.append_rows(rows)
@@ -1,17 +1,37 @@
+from functools import partial
+from tkinter import Misc
+
+_commands = {}
+
+
 def is_num_lt_max(val, max):
     if not val:
 
         return True
 
-    try:
-        val = int(val)
-
-    except ValueError:
+    if not (val.isascii() and val.isdigit()):
 
         return False
 
-    if val > max:
+    if int(val) > max:
 
         return False
 
     return True
+
+
+def get_validatecommand(widget: Misc,
+                        validator: callable,
+                        *args) -> tuple[str, str]:
+    root = widget._root()
+    key = (root.tk, validator, args)
+
+    if key not in _commands:
+        _commands[key] = root.register(partial(_call, validator, args))
+
+    return _commands[key], '%P'
+
+
+def _call(validator: callable, args: tuple, val: str) -> bool:
+
+    return validator(val, *args)
@@ -0,0 +1,110 @@
+import threading
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .models import Dish, RawType, RecipeLine
+from .schemas import CachedDish
+
+DATA_VERSION_KEY = 'lookup_data_version'
+CHECKED_KEY = 'lookup_checked'
+
+
+class LookupCache:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._types = None
+        self._type_names = None
+        self._dishes = None
+        self.dishes_generation = 0
+
+    def _check(self, session: Session) -> None:
+        # another process (second terminal, importer) may have recreated
+        # types or dishes; data_version changes on every commit made by a
+        # different connection
+        connection = session.connection()
+        transaction = session.get_transaction()
+
+        if session.info.get(CHECKED_KEY) is transaction:
+
+            return
+
+        session.info[CHECKED_KEY] = transaction
+        version = connection.exec_driver_sql('PRAGMA data_version').scalar()
+
+        if connection.info.get(DATA_VERSION_KEY) != version:
+            connection.info[DATA_VERSION_KEY] = version
+            self.invalidate_types()
+
+    def refresh(self, session: Session) -> int:
+        with self._lock:
+            self._check(session)
+
+            return self.dishes_generation
+
+    def _load_types(self, session: Session) -> None:
+        rows = session.execute(select(RawType.name, RawType.id)).all()
+
+        self._types = {name: type_id for name, type_id in rows}
+        self._type_names = {type_id: name for name, type_id in rows}
+
+    def _load_dishes(self, session: Session) -> None:
+        rows = session.execute(select(Dish.name,
+                                      Dish.id,
+                                      Dish.type_id,
+                                      Dish.amount)).all()
+        recipes = defaultdict(list)
+
+        for dish_id, type_id, amount in session.execute(
+                select(RecipeLine.dish_id,
+                       RecipeLine.type_id,
+                       RecipeLine.amount)):
+            recipes[dish_id].append((type_id, amount))
+
+        self._dishes = {name: CachedDish(dish_id,
+                                         type_id,
+                                         amount,
+                                         tuple(recipes[dish_id]))
+                        for name, dish_id, type_id, amount in rows}
+
+    def get_type_id(self, session: Session, name: str) -> int | None:
+        with self._lock:
+            self._check(session)
+
+            if self._types is None:
+                self._load_types(session)
+
+            return self._types.get(name)
+
+    def get_type_name(self, session: Session, type_id: int) -> str | None:
+        with self._lock:
+            self._check(session)
+
+            if self._type_names is None:
+                self._load_types(session)
+
+            return self._type_names.get(type_id)
+
+    def get_dish(self, session: Session, name: str) -> CachedDish | None:
+        with self._lock:
+            self._check(session)
+
+            if self._dishes is None:
+                self._load_dishes(session)
+
+            return self._dishes.get(name)
+
+    def invalidate_types(self) -> None:
+        with self._lock:
+            self._types = self._type_names = None
+            self._dishes = None
+            self.dishes_generation += 1
+
+    def invalidate_dishes(self) -> None:
+        with self._lock:
+            self._dishes = None
+            self.dishes_generation += 1
+
+
+lookup_cache = LookupCache()
@@ -0,0 +1,50 @@
+from collections import Counter, defaultdict
+
+
+def group_recipes(recipes) -> dict[str, list[tuple[str, int]]]:
+    lines = defaultdict(list)
+
+    for dish_name, type_name, grams in recipes:
+        lines[dish_name].append((type_name, grams))
+
+    return lines
+
+
+def format_recipe(lines) -> str:
+
+    return ', '.join(f'{type_name} {grams}' for type_name, grams in lines)
+
+
+def get_capacity_row(name: str,
+                     lines,
+                     fridge: dict[str, int],
+                     competing: dict[str, int]) -> tuple[str, str, int, int]:
+    limits = []
+
+    for type_name, grams in lines:
+        stock = max(fridge.get(type_name) or 0, 0)
+        limits.append((stock // grams,
+                       stock // competing[type_name] // grams,
+                       type_name))
+
+    if not limits:
+
+        return (name, '', 0, 0)
+
+    portions, _, type_name = min(limits)
+
+    return (name,
+            type_name,
+            portions,
+            min(fair for _, fair, _ in limits))
+
+
+def compute_capacity(dishes,
+                     recipes,
+                     amounts) -> tuple[tuple[str, str, int, int]]:
+    fridge = {name: fridge for name, fridge, _ in amounts}
+    competing = Counter(type_name for _, type_name, _ in recipes)
+    lines = group_recipes(recipes)
+
+    return tuple(get_capacity_row(dish[0], lines[dish[0]], fridge, competing)
+                 for dish in dishes)
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .models import DailyConsumption, RawType
+
+
+def record_consumption(session: Session, used: dict, day: date = None):
+    if not used:
+
+        return
+
+    statement = insert(DailyConsumption)
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=['type_id', 'day'],
+            set_={'grams': DailyConsumption.grams
+                  + statement.excluded.grams}),
+        [{'type_id': type_id, 'day': day or date.today(), 'grams': grams}
+         for type_id, grams in used.items()])
+
+
+def _since(days: int, today: date = None):
+
+    return (today or date.today()) - timedelta(days=days - 1)
+
+
+def get_daily_usage(session: Session,
+                    days: int,
+                    type_id: int = None,
+                    today: date = None):
+    query = (select(RawType.name, DailyConsumption.day, DailyConsumption.grams)
+             .join(RawType, RawType.id == DailyConsumption.type_id)
+             .where(DailyConsumption.day >= _since(days, today))
+             .order_by(RawType.name, DailyConsumption.day))
+
+    if type_id is not None:
+        query = query.where(DailyConsumption.type_id == type_id)
+
+    return session.execute(query).all()
+
+
+def get_usage_totals(session: Session, days: int, today: date = None):
+
+    return session.execute(
+        select(RawType.name, func.sum(DailyConsumption.grams))
+        .join(RawType, RawType.id == DailyConsumption.type_id)
+        .where(DailyConsumption.day >= _since(days, today))
+        .group_by(RawType.name)
+        .order_by(RawType.name)).all()
+
+
+def get_usage_sum(session: Session, days: int, today: date = None) -> int:
+
+    return session.scalar(
+        select(func.coalesce(func.sum(DailyConsumption.grams), 0))
+        .where(DailyConsumption.day >= _since(days, today)))
+
+
+def delete_type_consumption(session: Session, type_id: int):
+    session.execute(delete(DailyConsumption)
+                    .where(DailyConsumption.type_id == type_id))
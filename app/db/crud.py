@@ -1,82 +1,264 @@
 from collections import defaultdict
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from . import capacity, consumption, forecast, ledger
+from .cache import lookup_cache
+from .database import begin_write
 from .exceptions import ValidationError
-from .models import Dish, RawAmount, RawType
+from .models import Dish, RawAmount, RawType, RecipeLine
+from .schemas import Dashboard, ThawLine, TransferResult
+
+PAGE_SIZE = 100
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
 
 
 class CRUD:
     @staticmethod
-    def get_total(session: Session):
+    def _get_type_id(session: Session, name: str) -> int:
+        if (type_id := lookup_cache.get_type_id(session, name)) is None:
 
-        return (session.query(RawType.name, RawAmount.total)
-                .select_from(RawAmount)
-                .join(RawAmount.type)
-                .order_by(RawType.name)
-                .all())
+            raise ValidationError(f'Мяса вида "{name}" нет в базе!')
+
+        return type_id
 
     @staticmethod
-    def get_fridge(session: Session):
+    def _get_dish(session: Session, name: str):
+        if (dish := lookup_cache.get_dish(session, name)) is None:
 
-        return (session.query(RawType.name, RawAmount.fridge)
-                .select_from(RawAmount)
-                .join(RawAmount.type)
-                .order_by(RawType.name)
-                .all())
+            raise ValidationError(f'Блюда "{name}" нет в базе!')
+
+        return dish
 
     @staticmethod
-    def get_freezer(session: Session):
+    def _paginate(query,
+                  name_column,
+                  after: str | None,
+                  limit: int,
+                  search: str | None,
+                  substring: bool):
+        if after is not None:
+            query = query.where(name_column > after)
 
-        return (session.query(RawType.name, RawAmount.freezer)
-                .select_from(RawAmount)
-                .join(RawAmount.type)
-                .order_by(RawType.name)
-                .all())
+        if search and substring:
+            query = query.where(name_column.contains(search,
+                                                     autoescape=True))
+
+        elif search:
+            query = query.where(name_column >= search,
+                                name_column < search + PREFIX_UPPER_BOUND)
+
+        return query.order_by(name_column).limit(limit)
 
     @staticmethod
-    def get_types(session: Session):
+    def _get_recipes(session: Session, names=None):
+        query = (select(Dish.name, RawType.name, RecipeLine.amount)
+                 .select_from(RecipeLine)
+                 .join(RecipeLine.dish)
+                 .join(RecipeLine.type)
+                 .order_by(Dish.name, RawType.name))
+
+        if names is not None:
+            query = query.where(Dish.name.in_(names))
 
-        return session.query(RawType.name).order_by(RawType.name).all()
+        return tuple(tuple(line) for line in session.execute(query))
 
     @staticmethod
-    def get_dishes(session: Session):
+    def get_dashboard(session: Session,
+                      previous: Dashboard | None = None) -> Dashboard:
+        dishes_generation = lookup_cache.refresh(session)
+        types = session.execute(select(RawType.name,
+                                       RawAmount.fridge,
+                                       RawAmount.freezer)
+                                .outerjoin(RawType.amount)
+                                .order_by(RawType.name)).all()
+
+        if previous and previous.dishes_generation == dishes_generation:
+            dishes = previous.dishes
+            recipes = previous.recipes
+        else:
+            recipes = CRUD._get_recipes(session)
+            lines = capacity.group_recipes(recipes)
+            dishes = tuple(
+                (name, type_name, amount, capacity.format_recipe(lines[name]))
+                for name, type_name, amount in session.execute(
+                    select(Dish.name, RawType.name, Dish.amount)
+                    .join(Dish.type)
+                    .order_by(Dish.name)))
+
+        amounts = tuple((name, fridge, freezer)
+                        for name, fridge, freezer in types
+                        if fridge is not None)
+
+        if (previous and previous.dishes is dishes
+                and previous.amounts == amounts):
+            dishes_capacity = previous.capacity
+        else:
+            dishes_capacity = capacity.compute_capacity(
+                dishes, recipes, amounts)
+
+        return Dashboard(
+            types=tuple(name for name, _, _ in types),
+            amounts=amounts,
+            dishes=dishes,
+            dishes_generation=dishes_generation,
+            recipes=recipes,
+            forecasts=forecast.forecast_cache.get_forecasts(session, amounts),
+            capacity=dishes_capacity
+        )
 
-        return (session.query(Dish.name, RawType.name, Dish.amount)
-                .select_from(RawType)
-                .join(RawType.dishes)
-                .order_by(Dish.name)
-                .all())
+    @staticmethod
+    def get_thaw_plan(session: Session, days: int) -> list[ThawLine]:
+        amounts = session.execute(select(RawType.name,
+                                         RawAmount.fridge,
+                                         RawAmount.freezer)
+                                  .join(RawAmount.type)
+                                  .order_by(RawType.name)).all()
+        demand = forecast.forecast_cache.get_demand(
+            session, [name for name, _, _ in amounts], days)
+        plan = []
+
+        for name, fridge, freezer in amounts:
+            amount = min(max(demand[name] - fridge, 0), max(freezer, 0))
+
+            if amount:
+                plan.append(ThawLine(name, demand[name], fridge, freezer,
+                                     amount))
+
+        return plan
+
+    @staticmethod
+    def get_total_page(session: Session,
+                       after: str | None = None,
+                       limit: int = PAGE_SIZE,
+                       search: str | None = None,
+                       substring: bool = False):
+
+        return session.execute(CRUD._paginate(
+            select(RawType.name, RawAmount.total).join(RawAmount.type),
+            RawType.name, after, limit, search, substring)).all()
+
+    @staticmethod
+    def get_fridge_page(session: Session,
+                        after: str | None = None,
+                        limit: int = PAGE_SIZE,
+                        search: str | None = None,
+                        substring: bool = False):
+
+        return session.execute(CRUD._paginate(
+            select(RawType.name, RawAmount.fridge).join(RawAmount.type),
+            RawType.name, after, limit, search, substring)).all()
+
+    @staticmethod
+    def get_freezer_page(session: Session,
+                         after: str | None = None,
+                         limit: int = PAGE_SIZE,
+                         search: str | None = None,
+                         substring: bool = False):
+
+        return session.execute(CRUD._paginate(
+            select(RawType.name, RawAmount.freezer).join(RawAmount.type),
+            RawType.name, after, limit, search, substring)).all()
+
+    @staticmethod
+    def get_forecast_page(session: Session,
+                          after: str | None = None,
+                          limit: int = PAGE_SIZE,
+                          search: str | None = None,
+                          substring: bool = False):
+        amounts = session.execute(CRUD._paginate(
+            select(RawType.name, RawAmount.fridge, RawAmount.freezer)
+            .join(RawAmount.type),
+            RawType.name, after, limit, search, substring)).all()
+
+        return [tuple(row) for row in
+                forecast.forecast_cache.get_forecasts(session, amounts)]
 
     @staticmethod
-    def get_types_names(session: Session):
+    def get_types_page(session: Session,
+                       after: str | None = None,
+                       limit: int = PAGE_SIZE,
+                       search: str | None = None,
+                       substring: bool = False):
 
-        return session.execute(select(RawType.name)
-                               .order_by(RawType.name)).scalars().all()
+        return session.execute(CRUD._paginate(
+            select(RawType.name),
+            RawType.name, after, limit, search, substring)).all()
 
     @staticmethod
-    def get_dishes_names(session: Session):
+    def get_dishes_page(session: Session,
+                        after: str | None = None,
+                        limit: int = PAGE_SIZE,
+                        search: str | None = None,
+                        substring: bool = False):
+
+        rows = session.execute(CRUD._paginate(
+            select(Dish.name, RawType.name, Dish.amount).join(Dish.type),
+            Dish.name, after, limit, search, substring)).all()
+        lines = capacity.group_recipes(
+            CRUD._get_recipes(session, [name for name, _, _ in rows]))
+
+        return [(name, type_name, amount, capacity.format_recipe(lines[name]))
+                for name, type_name, amount in rows]
 
-        return session.execute(select(Dish.name)
-                               .order_by(Dish.name)).scalars().all()
+    @staticmethod
+    def get_capacity_page(session: Session,
+                          after: str | None = None,
+                          limit: int = PAGE_SIZE,
+                          search: str | None = None,
+                          substring: bool = False):
+        names = session.scalars(CRUD._paginate(
+            select(Dish.name).join(Dish.type),
+            Dish.name, after, limit, search, substring)).all()
+        lines = capacity.group_recipes(CRUD._get_recipes(session, names))
+        type_names = {type_name
+                      for dish_lines in lines.values()
+                      for type_name, _ in dish_lines}
+        competing = (select(RecipeLine.type_id,
+                            func.count().label('dishes'))
+                     .group_by(RecipeLine.type_id)
+                     .subquery())
+        rows = session.execute(
+            select(RawType.name, RawAmount.fridge, competing.c.dishes)
+            .join(competing, competing.c.type_id == RawType.id)
+            .outerjoin(RawType.amount)
+            .where(RawType.name.in_(type_names))).all()
+        fridge = {name: fridge for name, fridge, _ in rows}
+        competing = {name: dishes for name, _, dishes in rows}
+
+        return [capacity.get_capacity_row(name, lines[name], fridge, competing)
+                for name in names]
 
     @staticmethod
-    def get_type_freezer(session: Session, name: str):
-        type = session.query(RawType).filter_by(name=name).first()
+    def get_types_names_page(session: Session,
+                             after: str | None = None,
+                             limit: int = PAGE_SIZE,
+                             search: str | None = None,
+                             substring: bool = False):
 
-        return session.execute(select(RawAmount.freezer)
-                               .where(RawAmount.type == type)).scalar()
+        return session.execute(CRUD._paginate(
+            select(RawType.name),
+            RawType.name, after, limit, search, substring)).scalars().all()
 
     @staticmethod
-    def get_type_fridge(session: Session, name: str):
-        type = session.query(RawType).filter_by(name=name).first()
+    def get_dishes_names_page(session: Session,
+                              after: str | None = None,
+                              limit: int = PAGE_SIZE,
+                              search: str | None = None,
+                              substring: bool = False):
 
-        return session.execute(select(RawAmount.fridge)
-                               .where(RawAmount.type == type)).scalar()
+        return session.execute(CRUD._paginate(
+            select(Dish.name),
+            Dish.name, after, limit, search, substring)).scalars().all()
 
     @staticmethod
     def add_type(session: Session, name: str):
+        begin_write(session)
+
         if not name:
 
             raise ValidationError('Поле названия обязательно для заполнения!')
@@ -84,21 +266,72 @@ class CRUD:
         new_type = RawType(name=name)
 
         session.add(new_type)
-        session.commit()
+
+        try:
+            session.commit()
+
+        except IntegrityError:
+            session.rollback()
+
+            raise ValidationError('Такой вид мяса уже существует')
+
+        lookup_cache.invalidate_types()
+
+    @staticmethod
+    def add_types(session: Session, names: list[str]):
+        begin_write(session)
+
+        if not names:
+
+            raise ValidationError('Поле названия обязательно для заполнения!')
+
+        if len(set(names)) != len(names):
+
+            raise ValidationError('Названия видов мяса повторяются')
+
+        new_types = [RawType(name=name) for name in names]
+
+        if existing := session.execute(select(RawType.name)
+                                       .where(RawType.name.in_(names))
+                                       .order_by(RawType.name)
+                                       ).scalars().all():
+
+            raise ValidationError(f'Такой вид мяса уже существует: '
+                                  f'{", ".join(existing)}')
+
+        session.add_all(new_types)
+
+        try:
+            session.commit()
+
+        except IntegrityError:
+            session.rollback()
+
+            raise ValidationError('Такой вид мяса уже существует')
+
+        lookup_cache.invalidate_types()
 
     @staticmethod
     def delete_type(session: Session, name: str):
+        begin_write(session)
+
         if not name:
 
             raise ValidationError('Нельзя удалить то, чего нет')
 
-        db_type = session.query(RawType).filter_by(name=name).first()
+        db_type = session.get(RawType, CRUD._get_type_id(session, name))
 
+        ledger.delete_type_history(session, db_type.id)
+        consumption.delete_type_consumption(session, db_type.id)
         session.delete(db_type)
         session.commit()
+        lookup_cache.invalidate_types()
+        forecast.forecast_cache.invalidate()
 
     @staticmethod
     def add_dish(session: Session, data: dict):
+        begin_write(session)
+
         type_name = data.get('name')
         count_per_one = data.get('count_per_one')
         dish_name = data.get('dish_name')
@@ -125,17 +358,21 @@ class CRUD:
 
             raise ValidationError('Это не число')
 
-        db_type = session.query(RawType).filter_by(name=type_name).first()
-
-        new_dish = Dish(type=db_type,
+        type_id = CRUD._get_type_id(session, type_name)
+        new_dish = Dish(type_id=type_id,
                         amount=int(count_per_one),
                         name=dish_name)
+        new_dish.recipe = [RecipeLine(type_id=type_id,
+                                      amount=int(count_per_one))]
         session.add(new_dish)
 
         session.commit()
+        lookup_cache.invalidate_dishes()
 
     @staticmethod
     def update_dish(session: Session, data: dict):
+        begin_write(session)
+
         name = data.get('name')
         count_per_one = data.get('count_per_one')
 
@@ -155,26 +392,99 @@ class CRUD:
 
             raise ValidationError('Это не число')
 
-        dish = session.query(Dish).filter_by(name=name).first()
+        dish = session.get(Dish, CRUD._get_dish(session, name).id)
 
         dish.amount = int(count_per_one)
+
+        for line in dish.recipe:
+            if line.type_id == dish.type_id:
+                line.amount = dish.amount
+
         session.add(dish)
         session.commit()
+        lookup_cache.invalidate_dishes()
         session.refresh(dish)
 
+    @staticmethod
+    def get_recipe(session: Session, name: str):
+        dish_id = CRUD._get_dish(session, name).id
+
+        return (session.query(RawType.name, RecipeLine.amount)
+                .select_from(RecipeLine)
+                .join(RecipeLine.type)
+                .filter(RecipeLine.dish_id == dish_id)
+                .order_by(RawType.name)
+                .all())
+
+    @staticmethod
+    def set_recipe(session: Session, name: str, lines: dict):
+        begin_write(session)
+
+        if not lines:
+
+            raise ValidationError('В рецепте должна быть хотя бы '
+                                  'одна строка!')
+
+        recipe = {}
+
+        for type_name, amount in lines.items():
+            try:
+                amount = int(amount)
+
+            except (TypeError, ValueError):
+
+                raise ValidationError('Это не число')
+
+            if amount <= 0:
+
+                raise ValidationError('Количество на порцию '
+                                      'не может быть меньше/равно нулю')
+
+            recipe[CRUD._get_type_id(session, type_name)] = amount
+
+        dish = session.get(Dish, CRUD._get_dish(session, name).id)
+
+        if dish.type_id not in recipe:
+
+            raise ValidationError(f'В рецепте блюда "{name}" нет '
+                                  f'основного сырья!')
+
+        current = {line.type_id: line for line in dish.recipe}
+
+        for type_id, line in current.items():
+            if type_id not in recipe:
+                session.delete(line)
+
+        for type_id, amount in recipe.items():
+            if type_id in current:
+                current[type_id].amount = amount
+            else:
+                session.add(RecipeLine(dish_id=dish.id,
+                                       type_id=type_id,
+                                       amount=amount))
+
+        dish.amount = recipe[dish.type_id]
+        session.commit()
+        lookup_cache.invalidate_dishes()
+
     @staticmethod
     def delete_dish(session: Session, name: str):
+        begin_write(session)
+
         if not name:
 
             raise ValidationError('Нельзя удалить то, чего нет')
 
-        db_dish = session.query(Dish).filter_by(name=name).first()
+        db_dish = session.get(Dish, CRUD._get_dish(session, name).id)
 
         session.delete(db_dish)
         session.commit()
+        lookup_cache.invalidate_dishes()
 
     @staticmethod
-    def add_amount(session: Session, data: dict):
+    def add_amount(session: Session, data: dict, commit: bool = True):
+        begin_write(session)
+
         name = data.get('name')
         amount = data.get('amount')
 
@@ -195,21 +505,63 @@ class CRUD:
 
             raise ValidationError('Это не число')
 
-        db_type = session.query(RawType).filter_by(name=name).first()
+        type_id = CRUD._get_type_id(session, name)
+        statement = insert(RawAmount).values(type_id=type_id,
+                                             fridge=0,
+                                             freezer=int(amount))
+
+        session.flush()
+        balance = session.execute(
+            statement.on_conflict_do_update(
+                index_elements=['type_id'],
+                set_={'freezer': RawAmount.freezer
+                      + statement.excluded.freezer})
+            .returning(RawAmount.fridge, RawAmount.freezer)).one()
+        ledger.record_movements(session,
+                                ledger.DELIVERY,
+                                [{'type_id': type_id,
+                                  'freezer': int(amount)}])
+
+        if commit:
+            session.commit()
 
-        if raw_amount := (session.query(RawAmount)
-                          .filter_by(type=db_type).first()):
-            raw_amount.freezer += int(amount)
+        return balance
 
-        else:
-            raw_amount = RawAmount(type=db_type,
-                                   freezer=int(amount))
-            session.add(raw_amount)
+    @staticmethod
+    def _get_report_error(session: Session,
+                          data: dict,
+                          dishes: dict) -> ValidationError:
+        fridge = dict(session.execute(
+            select(RawAmount.type_id, RawAmount.fridge)
+            .where(RawAmount.type_id.in_(
+                {type_id for dish in dishes.values()
+                 for type_id, _ in dish.recipe}))).all())
 
-        session.commit()
+        for name, amount in data.items():
+            for type_id, grams in dishes[name].recipe:
+                type_name = lookup_cache.get_type_name(session, type_id)
+
+                if type_id not in fridge:
+
+                    return ValidationError(f'Мясо вида "{type_name}" '
+                                           f'пока не было добавлено в базу!')
+
+                fridge[type_id] -= int(amount) * grams
+
+                if fridge[type_id] < 0:
+
+                    return ValidationError(f'При таком количестве порций '
+                                           f'({amount}) количество мяса вида '
+                                           f'"{type_name}" станет '
+                                           f'отрицательным!')
+
+        return ValidationError('Количество мяса изменилось, '
+                               'попробуйте ещё раз')
 
     @staticmethod
-    def add_report(session: Session, data: dict):
+    def add_report(session: Session, data: dict, commit: bool = True):
+        begin_write(session)
+
         results = defaultdict(int)
 
         for name, amount in data.items():
@@ -230,99 +582,181 @@ class CRUD:
 
                 raise ValidationError('Это не число')
 
-            dish = (session.query(Dish)
-                    .filter_by(name=name).first())
+        if not data:
+
+            return results
+
+        dishes = {name: CRUD._get_dish(session, name) for name in data}
+        used = defaultdict(int)
+
+        # portions vector times the sparse recipe matrix
+        for name, amount in data.items():
+            for type_id, grams in dishes[name].recipe:
+                used[type_id] += int(amount) * grams
 
-            if raw_amount := (session.query(RawAmount)
-                              .filter_by(type=dish.type).first()):
-                used_amount = int(amount) * dish.amount
-                raw_amount.fridge -= used_amount
+        savepoint = session.begin_nested()
 
-                if raw_amount.fridge < 0:
+        for type_id, amount in used.items():
+            balance = session.execute(
+                update(RawAmount)
+                .where(RawAmount.type_id == type_id,
+                       RawAmount.fridge >= amount)
+                .values(fridge=RawAmount.fridge - amount)
+                .returning(RawAmount.fridge)
+                .execution_options(synchronize_session='fetch')).first()
 
+            if balance is None:
+                savepoint.rollback()
+                error = CRUD._get_report_error(session, data, dishes)
+
+                if commit:
                     session.rollback()
 
-                    raise ValidationError(f'При таком количестве порций '
-                                          f'({amount}) количество мяса вида '
-                                          f'"{raw_amount.type.name}" станет '
-                                          f'отрицательным!')
+                raise error
 
-                results[raw_amount.type.name] += used_amount
-            else:
-                session.rollback()
+            results[lookup_cache.get_type_name(session, type_id)] += amount
 
-                raise ValidationError(f'Мясо вида "{dish.type.name}" '
-                                      f'пока не было добавлено в базу!')
+        ledger.record_movements(session,
+                                ledger.REPORT,
+                                [{'type_id': type_id, 'fridge': -amount}
+                                 for type_id, amount in used.items()])
+        consumption.record_consumption(session, used)
+        savepoint.commit()
+        forecast.defer_usage(session, results)
 
-        session.commit()
+        if commit:
+            session.commit()
 
         return results
 
     @staticmethod
-    def freezer_to_fridge(session: Session, data: dict):
-        name = data.get('name')
-        amount = data.get('amount')
+    def transfer_batch(session: Session,
+                       lines: list[dict],
+                       direction: str,
+                       commit: bool = True) -> list[TransferResult]:
+        begin_write(session)
 
-        if not name:
+        if direction == ledger.FREEZER_TO_FRIDGE:
+            source, target = RawAmount.freezer, RawAmount.fridge
+            shortage = 'Недостаточно мяса вида "{name}" в морозильнике'
 
-            raise ValidationError('Поле названия '
-                                  'обязательно для заполнения!')
+        elif direction == ledger.FRIDGE_TO_FREEZER:
+            source, target = RawAmount.fridge, RawAmount.freezer
+            shortage = 'Недостаточно мяса вида "{name}" в холодильнике'
 
-        if not amount:
+        else:
 
-            raise ValidationError('Поле количества '
-                                  'обязательно для заполнения!')
+            raise ValidationError(f'Неизвестное направление "{direction}"')
 
-        try:
-            float(amount)
+        savepoint = session.begin_nested()
+        results = []
+        moved = []
 
-        except ValueError:
+        for line in lines:
+            name = line.get('name')
+            amount = line.get('amount')
 
-            raise ValidationError('Это не число')
+            try:
+                if not name:
 
-        type = session.query(RawType).filter_by(name=name).first()
+                    raise ValidationError('Поле названия '
+                                          'обязательно для заполнения!')
 
-        if raw_amount := session.query(RawAmount).filter_by(type=type).first():
-            raw_amount.freezer -= int(amount)
-            raw_amount.fridge += int(amount)
+                if not amount:
 
-            session.commit()
+                    raise ValidationError('Поле количества '
+                                          'обязательно для заполнения!')
 
-    @staticmethod
-    def fridge_to_freezer(session: Session, data: dict):
-        name = data.get('name')
-        amount = data.get('amount')
+                try:
+                    amount = int(float(amount))
 
-        if not name:
+                except ValueError:
 
-            raise ValidationError('Поле названия '
-                                  'обязательно для заполнения!')
+                    raise ValidationError('Это не число')
 
-        if not amount:
+                if amount <= 0:
 
-            raise ValidationError('Поле количества '
-                                  'обязательно для заполнения!')
+                    raise ValidationError('Количество для переноса '
+                                          'должно быть больше нуля')
 
-        try:
-            float(amount)
+                type_id = CRUD._get_type_id(session, name)
 
-        except ValueError:
+            except ValidationError as error:
+                results.append(TransferResult(name,
+                                              amount,
+                                              error=error.message))
 
-            raise ValidationError('Это не число')
+                continue
+
+            balance = session.execute(
+                update(RawAmount)
+                .where(RawAmount.type_id == type_id, source >= amount)
+                .values({source: source - amount, target: target + amount})
+                .returning(RawAmount.fridge, RawAmount.freezer)
+                .execution_options(synchronize_session='fetch')).first()
+
+            if balance is None:
+                results.append(TransferResult(
+                    name, amount, error=shortage.format(name=name)))
+
+                continue
+
+            moved.append((type_id, amount))
+            results.append(TransferResult(name, amount, *balance))
+
+        if any(result.error for result in results):
+            savepoint.rollback()
+
+            if commit:
+                session.rollback()
 
-        type = session.query(RawType).filter_by(name=name).first()
+            return [result._replace(fridge=None, freezer=None)
+                    for result in results]
 
-        if raw_amount := session.query(RawAmount).filter_by(type=type).first():
-            raw_amount.fridge -= int(amount)
-            raw_amount.freezer += int(amount)
+        ledger.record_movements(session,
+                                direction,
+                                [{'type_id': type_id,
+                                  source.key: -amount,
+                                  target.key: amount}
+                                 for type_id, amount in moved])
+        savepoint.commit()
 
+        if commit:
             session.commit()
 
+        return results
+
+    @staticmethod
+    def _transfer(session: Session,
+                  data: dict,
+                  direction: str,
+                  commit: bool):
+        result, = CRUD.transfer_batch(session, [data], direction, commit)
+
+        if result.error:
+
+            raise ValidationError(result.error)
+
+        return result
+
+    @staticmethod
+    def freezer_to_fridge(session: Session, data: dict, commit: bool = True):
+
+        return CRUD._transfer(session, data, ledger.FREEZER_TO_FRIDGE, commit)
+
+    @staticmethod
+    def fridge_to_freezer(session: Session, data: dict, commit: bool = True):
+
+        return CRUD._transfer(session, data, ledger.FRIDGE_TO_FREEZER, commit)
+
     @staticmethod
     def update_amount(session: Session, data: dict):
+        begin_write(session)
+
         name = data.get('name')
         amount = data.get('amount')
         db_row_name = data.get('db_row_name')
+        expected = data.get('expected')
 
         if not name:
 
@@ -341,12 +775,61 @@ class CRUD:
 
             raise ValidationError('Это не число')
 
-        type = session.query(RawType).filter_by(name=name).first()
+        if db_row_name not in ('fridge', 'freezer'):
 
-        if raw_amount := session.query(RawAmount).filter_by(type=type).first():
-            setattr(raw_amount, db_row_name, amount)
+            raise ValidationError(f'Неизвестное место хранения '
+                                  f'"{db_row_name}"')
 
-            session.commit()
+        type_id = CRUD._get_type_id(session, name)
+        column = getattr(RawAmount, db_row_name)
+
+        if expected is None:
+            expected = session.scalar(select(column)
+                                      .where(RawAmount.type_id == type_id))
+
+            if expected is None:
+
+                return
+
+        if session.execute(
+                update(RawAmount)
+                .where(RawAmount.type_id == type_id,
+                       column == int(expected))
+                .values({column: int(amount)})
+                .execution_options(synchronize_session='fetch')
+        ).rowcount != 1:
+
+            raise ValidationError('Количество мяса изменилось, '
+                                  'попробуйте ещё раз')
+
+        ledger.record_movements(session,
+                                ledger.CORRECTION,
+                                [{'type_id': type_id,
+                                  db_row_name: int(amount) - int(expected)}])
+        session.commit()
+
+    @staticmethod
+    def get_balance_at(session: Session, name: str, moment: datetime):
+        return ledger.get_balance_at(session,
+                                     CRUD._get_type_id(session, name),
+                                     moment)
+
+    @staticmethod
+    def get_daily_usage(session: Session, days: int, name: str = None):
+        type_id = None if name is None else CRUD._get_type_id(session, name)
+
+        return consumption.get_daily_usage(session, days, type_id)
+
+    @staticmethod
+    def get_usage_totals(session: Session, days: int):
+        return consumption.get_usage_totals(session, days)
+
+    @staticmethod
+    def take_snapshot(session: Session):
+        begin_write(session)
+
+        ledger.take_snapshot(session)
+        session.commit()
 
 
 crud = CRUD()
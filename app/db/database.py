@@ -1,6 +1,29 @@
-from sqlalchemy import Column, Integer, create_engine
+import os
+
+from sqlalchemy import Column, Integer, create_engine, event
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+
+from .exceptions import ValidationError
+from .migrations import migrate
+
+DB_PATH = os.getenv('FRESH_MEAT_DB_PATH', 'sqlite.db')
+IMMEDIATE = 'sqlite_immediate'
+
+DEFAULT_SQLITE_PROFILE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000
+}
+
+SQLITE_PROFILE = {
+    pragma: os.getenv(f'FRESH_MEAT_SQLITE_{pragma.upper()}', value)
+    for pragma, value in DEFAULT_SQLITE_PROFILE.items()
+}
 
 
 class PreBase:
@@ -13,11 +36,49 @@ class PreBase:
     id = Column(Integer, primary_key=True)
 
 
-engine = create_engine('sqlite:///sqlite.db')
+engine = create_engine(f'sqlite:///{DB_PATH}')
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base(cls=PreBase)
 
 
+@event.listens_for(engine, 'connect')
+def _apply_sqlite_profile(dbapi_connection, connection_record):
+    # let SQLAlchemy emit BEGIN itself so that SAVEPOINT works with pysqlite
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+
+    for pragma, value in SQLITE_PROFILE.items():
+        cursor.execute(f'PRAGMA {pragma} = {value}')
+
+    cursor.close()
+
+
+@event.listens_for(engine, 'begin')
+def _begin(connection):
+    connection.exec_driver_sql(
+        'BEGIN IMMEDIATE' if connection.get_execution_options().get(IMMEDIATE)
+        else 'BEGIN')
+
+
+@event.listens_for(engine, 'handle_error')
+def _database_locked(context):
+    if (isinstance(context.sqlalchemy_exception, OperationalError)
+            and 'locked' in str(context.original_exception)):
+
+        raise ValidationError('База данных занята другим пользователем, '
+                              'попробуйте ещё раз')
+
+
+def begin_write(session: Session) -> None:
+    # a deferred transaction that has already read cannot take the write
+    # lock in WAL mode once another connection commits, so take it first
+    if not session.in_transaction():
+        session.connection(execution_options={IMMEDIATE: True})
+
+
 def create_db():
     Base.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        migrate(connection)
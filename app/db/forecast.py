@@ -0,0 +1,156 @@
+import threading
+from collections import defaultdict
+from datetime import date
+from math import ceil, sqrt
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from . import consumption
+from .database import SessionLocal
+from .schemas import Forecast
+
+FORECAST_WINDOW_DAYS = 28
+LEAD_TIME_DAYS = 2
+SAFETY_FACTOR = 1.65
+
+PENDING_USAGE_KEY = 'forecast_usage'
+
+
+class ForecastCache:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._today = None
+        self._grams = None
+        self._usage = None
+        self._totals = None
+        self._squares = None
+        self._weekdays = None
+        self._forecasts = {}
+
+    def _load(self, session: Session, today: date, grams: int) -> None:
+        self._today = today
+        self._grams = grams
+        self._usage = defaultdict(dict)
+        self._totals = defaultdict(int)
+        self._squares = defaultdict(int)
+        self._weekdays = defaultdict(lambda: [0] * 7)
+        self._forecasts = {}
+
+        for name, day, grams in consumption.get_daily_usage(
+                session, FORECAST_WINDOW_DAYS, today=today):
+            self._add(name, day, grams)
+
+    def _add(self, name: str, day: date, grams: int) -> None:
+        before = self._usage[name].get(day, 0)
+        after = before + grams
+
+        self._usage[name][day] = after
+        self._totals[name] += grams
+        self._squares[name] += after * after - before * before
+        self._weekdays[name][day.weekday()] += grams
+        self._forecasts.pop(name, None)
+
+    def _ensure(self, session: Session, today: date) -> None:
+        # reports committed by other processes (importer, second terminal)
+        # never reach add_usage, so compare the window total with the table
+        grams = consumption.get_usage_sum(session,
+                                          FORECAST_WINDOW_DAYS,
+                                          today=today)
+
+        if (self._usage is None or today != self._today
+                or grams != self._grams):
+            self._load(session, today, grams)
+
+    def _compute(self, name: str, stock: int) -> Forecast:
+        total = self._totals.get(name, 0)
+        daily = total / FORECAST_WINDOW_DAYS
+        variance = max(self._squares.get(name, 0) / FORECAST_WINDOW_DAYS
+                       - daily * daily, 0)
+        weekday = self._weekdays[name][self._today.weekday()] if total else 0
+        reorder_point = (daily * LEAD_TIME_DAYS
+                         + SAFETY_FACTOR * sqrt(variance * LEAD_TIME_DAYS))
+
+        return Forecast(
+            name=name,
+            daily=round(daily),
+            today=round(weekday * 7 / FORECAST_WINDOW_DAYS),
+            days_of_cover=round(stock / daily, 1) if daily else None,
+            reorder_point=round(reorder_point)
+        )
+
+    def get_forecasts(self,
+                      session: Session,
+                      amounts,
+                      today: date = None) -> tuple[Forecast, ...]:
+        with self._lock:
+            self._ensure(session, today or date.today())
+            forecasts = []
+
+            for name, fridge, freezer in amounts:
+                stock = fridge + freezer
+                cached = self._forecasts.get(name)
+
+                if cached is None or cached[0] != stock:
+                    cached = self._forecasts[name] = (
+                        stock, self._compute(name, stock))
+
+                forecasts.append(cached[1])
+
+            return tuple(forecasts)
+
+    def get_demand(self,
+                   session: Session,
+                   names,
+                   days: int,
+                   today: date = None) -> dict[str, int]:
+        with self._lock:
+            self._ensure(session, today or date.today())
+            weekdays = [0] * 7
+
+            for offset in range(days):
+                weekdays[(self._today.weekday() + offset) % 7] += 1
+
+            return {name: ceil(sum(total * count for total, count
+                                   in zip(self._weekdays[name], weekdays))
+                               * 7 / FORECAST_WINDOW_DAYS)
+                    if self._totals.get(name) else 0
+                    for name in names}
+
+    def add_usage(self, used: dict, day: date = None) -> None:
+        with self._lock:
+            if self._usage is None:
+
+                return
+
+            if (day or date.today()) != self._today:
+                self._usage = None
+
+                return
+
+            for name, grams in used.items():
+                self._add(name, self._today, grams)
+                self._grams += grams
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._usage = None
+            self._forecasts = {}
+
+
+forecast_cache = ForecastCache()
+
+
+def defer_usage(session: Session, used: dict) -> None:
+    session.info.setdefault(PENDING_USAGE_KEY, []).append(dict(used))
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _apply_usage(session):
+    for used in session.info.pop(PENDING_USAGE_KEY, ()):
+        forecast_cache.add_usage(used)
+
+
+@event.listens_for(SessionLocal, 'after_soft_rollback')
+def _drop_usage(session, previous_transaction):
+    session.info.pop(PENDING_USAGE_KEY, None)
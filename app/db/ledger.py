@@ -0,0 +1,89 @@
+from datetime import datetime
+
+from sqlalchemy import delete, event, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from .models import RawAmount, StockMovement, StockSnapshot
+
+DELIVERY = 'delivery'
+REPORT = 'report'
+FREEZER_TO_FRIDGE = 'freezer_to_fridge'
+FRIDGE_TO_FREEZER = 'fridge_to_freezer'
+CORRECTION = 'correction'
+
+SNAPSHOT_INTERVAL = 1000
+
+
+def _snapshot_select(movement_id, created_at):
+
+    return (select(RawAmount.type_id,
+                   literal(movement_id),
+                   func.sum(RawAmount.fridge),
+                   func.sum(RawAmount.freezer),
+                   literal(created_at))
+            .where(RawAmount.type_id.isnot(None))
+            .group_by(RawAmount.type_id))
+
+
+def _snapshot_insert(movement_id, created_at):
+
+    return insert(StockSnapshot).from_select(
+        ['type_id', 'movement_id', 'fridge', 'freezer', 'created_at'],
+        _snapshot_select(movement_id, created_at))
+
+
+@event.listens_for(StockSnapshot.metadata, 'after_create')
+def _take_baseline(target, connection, tables=(), **kw):
+    if StockSnapshot.__table__ in tables:
+        connection.execute(_snapshot_insert(0, datetime.now()))
+
+
+def take_snapshot(session: Session):
+    session.flush()
+    movement_id = session.scalar(select(func.max(StockMovement.id))) or 0
+
+    session.execute(_snapshot_insert(movement_id, datetime.now()))
+
+
+def record_movements(session: Session, kind: str, movements: list[dict]):
+    if not movements:
+
+        return
+
+    created_at = datetime.now()
+    ids = session.scalars(
+        insert(StockMovement).returning(StockMovement.id),
+        [{'kind': kind, 'created_at': created_at, **movement}
+         for movement in movements]).all()
+
+    if max(ids) // SNAPSHOT_INTERVAL > (min(ids) - 1) // SNAPSHOT_INTERVAL:
+        take_snapshot(session)
+
+
+def get_balance_at(session: Session, type_id: int, moment: datetime):
+    snapshot = session.execute(
+        select(StockSnapshot.movement_id,
+               StockSnapshot.fridge,
+               StockSnapshot.freezer)
+        .where(StockSnapshot.type_id == type_id,
+               StockSnapshot.created_at <= moment)
+        .order_by(StockSnapshot.created_at.desc(),
+                  StockSnapshot.id.desc())
+        .limit(1)).first()
+    movement_id, fridge, freezer = snapshot or (0, 0, 0)
+
+    tail_fridge, tail_freezer = session.execute(
+        select(func.coalesce(func.sum(StockMovement.fridge), 0),
+               func.coalesce(func.sum(StockMovement.freezer), 0))
+        .where(StockMovement.type_id == type_id,
+               StockMovement.id > movement_id,
+               StockMovement.created_at <= moment)).one()
+
+    return fridge + tail_fridge, freezer + tail_freezer
+
+
+def delete_type_history(session: Session, type_id: int):
+    session.execute(delete(StockMovement)
+                    .where(StockMovement.type_id == type_id))
+    session.execute(delete(StockSnapshot)
+                    .where(StockSnapshot.type_id == type_id))
@@ -0,0 +1,53 @@
+from sqlalchemy.engine import Connection
+
+MIGRATIONS = (
+    (1, (
+        'DELETE FROM rawamount WHERE type_id IS NULL',
+        'UPDATE rawamount '
+        'SET fridge = (SELECT SUM(dup.fridge) FROM rawamount AS dup '
+        '              WHERE dup.type_id = rawamount.type_id), '
+        '    freezer = (SELECT SUM(dup.freezer) FROM rawamount AS dup '
+        '               WHERE dup.type_id = rawamount.type_id) '
+        'WHERE id IN (SELECT MIN(id) FROM rawamount '
+        '             GROUP BY type_id HAVING COUNT(*) > 1)',
+        'DELETE FROM rawamount '
+        'WHERE id NOT IN (SELECT MIN(id) FROM rawamount GROUP BY type_id)',
+        'CREATE UNIQUE INDEX IF NOT EXISTS ix_rawamount_type_id '
+        'ON rawamount (type_id)',
+        'CREATE INDEX IF NOT EXISTS ix_dish_type_id ON dish (type_id)',
+    )),
+    (2, (
+        "INSERT INTO dailyconsumption (type_id, day, grams) "
+        "SELECT type_id, date(created_at), -SUM(fridge) FROM stockmovement "
+        "WHERE kind = 'report' GROUP BY type_id, date(created_at) "
+        "ON CONFLICT (type_id, day) DO NOTHING",
+    )),
+    (3, (
+        'INSERT INTO recipeline (dish_id, type_id, amount) '
+        'SELECT id, type_id, amount FROM dish WHERE type_id IS NOT NULL '
+        'ON CONFLICT (dish_id, type_id) DO NOTHING',
+    )),
+    (4, (
+        'CREATE INDEX IF NOT EXISTS ix_dailyconsumption_day_grams '
+        'ON dailyconsumption (day, grams)',
+    )),
+)
+
+
+def get_version(connection: Connection) -> int:
+
+    return connection.exec_driver_sql('PRAGMA user_version').scalar()
+
+
+def migrate(connection: Connection) -> None:
+    version = get_version(connection)
+
+    for number, statements in MIGRATIONS:
+        if number <= version:
+
+            continue
+
+        for statement in statements:
+            connection.exec_driver_sql(statement)
+
+        connection.exec_driver_sql(f'PRAGMA user_version = {number}')
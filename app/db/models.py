@@ -1,16 +1,22 @@
-from sqlalchemy import Column, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import (Column, Date, DateTime, ForeignKey, Index, Integer,
+                        String)
 from sqlalchemy.orm import column_property, relationship, validates
 
-from .database import Base, SessionLocal
+from .database import Base
 from .exceptions import ValidationError
 
-session = SessionLocal()
-
 
 class RawType(Base):
     name = Column(String(length=200), unique=True, nullable=False)
     dishes = relationship('Dish', back_populates='type', cascade='all, delete')
-    amount = relationship('RawAmount', back_populates='type')
+    amount = relationship('RawAmount',
+                          back_populates='type',
+                          cascade='all, delete')
+    recipe_lines = relationship('RecipeLine',
+                                back_populates='type',
+                                cascade='all, delete')
 
     @validates('name', include_backrefs=False)
     def validate_name(self, key, name):
@@ -18,10 +24,6 @@ class RawType(Base):
 
             raise ValidationError('Введите название')
 
-        if session.query(RawType).filter_by(name=name).first():
-
-            raise ValidationError('Такой вид мяса уже существует')
-
         if len(name) > 200:
 
             raise ValidationError('Слишком длинное название вида')
@@ -31,9 +33,12 @@ class RawType(Base):
 
 class Dish(Base):
     type = relationship('RawType', back_populates='dishes')
-    type_id = Column(Integer, ForeignKey('rawtype.id'))
+    type_id = Column(Integer, ForeignKey('rawtype.id'), index=True)
     amount = Column(Integer, unique=False, nullable=False)
     name = Column(String(length=200), unique=True, nullable=False)
+    recipe = relationship('RecipeLine',
+                          back_populates='dish',
+                          cascade='all, delete')
 
     @validates('amount')
     def validate_amount(self, key, amount):
@@ -56,9 +61,39 @@ class Dish(Base):
         return amount
 
 
+class RecipeLine(Base):
+    dish = relationship('Dish', back_populates='recipe')
+    dish_id = Column(Integer, ForeignKey('dish.id'), nullable=False)
+    type = relationship('RawType', back_populates='recipe_lines')
+    type_id = Column(Integer,
+                     ForeignKey('rawtype.id'),
+                     nullable=False,
+                     index=True)
+    amount = Column(Integer, unique=False, nullable=False)
+
+    __table_args__ = (
+        Index('ix_recipeline_dish_id_type_id',
+              'dish_id',
+              'type_id',
+              unique=True),
+    )
+
+    @validates('amount')
+    def validate_amount(self, key, amount):
+        if amount <= 0:
+
+            raise ValidationError('Количество на порцию '
+                                  'не может быть меньше/равно нулю')
+
+        return amount
+
+
 class RawAmount(Base):
     type = relationship('RawType', back_populates='amount')
-    type_id = Column(Integer, ForeignKey('rawtype.id'))
+    type_id = Column(Integer,
+                     ForeignKey('rawtype.id'),
+                     index=True,
+                     unique=True)
     fridge = Column(Integer, unique=False, nullable=False, default=0)
     freezer = Column(Integer, unique=False, nullable=False, default=0)
     total = column_property(fridge + freezer)
@@ -73,3 +108,41 @@ class RawAmount(Base):
             raise ValidationError('Это не число')
 
         return freezer
+
+
+class StockMovement(Base):
+    type_id = Column(Integer, ForeignKey('rawtype.id'), nullable=False)
+    kind = Column(String(length=50), nullable=False)
+    fridge = Column(Integer, unique=False, nullable=False, default=0)
+    freezer = Column(Integer, unique=False, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        Index('ix_stockmovement_type_id_id', 'type_id', 'id'),
+    )
+
+
+class StockSnapshot(Base):
+    type_id = Column(Integer, ForeignKey('rawtype.id'), nullable=False)
+    movement_id = Column(Integer, nullable=False, default=0)
+    fridge = Column(Integer, unique=False, nullable=False, default=0)
+    freezer = Column(Integer, unique=False, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        Index('ix_stocksnapshot_type_id_created_at', 'type_id', 'created_at'),
+    )
+
+
+class DailyConsumption(Base):
+    type_id = Column(Integer, ForeignKey('rawtype.id'), nullable=False)
+    day = Column(Date, nullable=False)
+    grams = Column(Integer, unique=False, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('ix_dailyconsumption_type_id_day',
+              'type_id',
+              'day',
+              unique=True),
+        Index('ix_dailyconsumption_day_grams', 'day', 'grams'),
+    )
@@ -0,0 +1,88 @@
+from typing import NamedTuple
+
+
+class Forecast(NamedTuple):
+    name: str
+    daily: int
+    today: int
+    days_of_cover: float | None
+    reorder_point: int
+
+
+class Dashboard(NamedTuple):
+    types: tuple[str, ...]
+    amounts: tuple[tuple[str, int, int], ...]
+    dishes: tuple[tuple[str, str, int, str], ...]
+    dishes_generation: int = 0
+    recipes: tuple[tuple[str, str, int], ...] = ()
+    forecasts: tuple[Forecast, ...] = ()
+    capacity: tuple[tuple[str, str, int, int], ...] = ()
+
+    def get_total(self) -> tuple[tuple[str, int], ...]:
+
+        return tuple((name, fridge + freezer)
+                     for name, fridge, freezer in self.amounts)
+
+    def get_fridge(self) -> tuple[tuple[str, int], ...]:
+
+        return tuple((name, fridge) for name, fridge, _ in self.amounts)
+
+    def get_freezer(self) -> tuple[tuple[str, int], ...]:
+
+        return tuple((name, freezer) for name, _, freezer in self.amounts)
+
+    def get_forecast(self) -> tuple[tuple, ...]:
+
+        return tuple(tuple(forecast) for forecast in self.forecasts)
+
+    def get_dishes_names(self) -> tuple[str, ...]:
+
+        return tuple(dish[0] for dish in self.dishes)
+
+    def get_type_fridge(self, name: str) -> int | None:
+
+        return next((fridge for type_name, fridge, _ in self.amounts
+                     if type_name == name), None)
+
+    def get_type_freezer(self, name: str) -> int | None:
+
+        return next((freezer for type_name, _, freezer in self.amounts
+                     if type_name == name), None)
+
+    def get_rows(self, pane: str) -> tuple[tuple, ...]:
+        if pane == 'types':
+
+            return tuple((name, ) for name in self.types)
+
+        if pane == 'dishes':
+
+            return self.dishes
+
+        if pane == 'capacity':
+
+            return self.capacity
+
+        return getattr(self, f'get_{pane}')()
+
+
+class CachedDish(NamedTuple):
+    id: int
+    type_id: int
+    amount: int
+    recipe: tuple[tuple[int, int], ...] = ()
+
+
+class TransferResult(NamedTuple):
+    name: str
+    amount: int
+    fridge: int | None = None
+    freezer: int | None = None
+    error: str | None = None
+
+
+class ThawLine(NamedTuple):
+    name: str
+    demand: int
+    fridge: int
+    freezer: int
+    amount: int
@@ -0,0 +1,186 @@
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+import constants
+from db.crud import crud
+from db.database import SessionLocal, create_db
+from db.exceptions import ValidationError
+
+
+def _read_csv(file):
+    reader = csv.DictReader(file)
+
+    for row in reader:
+
+        yield reader.line_num, row
+
+
+def _read_jsonl(file):
+    for line_num, line in enumerate(file, start=1):
+        if not line.strip():
+
+            continue
+
+        try:
+            row = json.loads(line)
+
+        except ValueError:
+            row = None
+
+        yield line_num, row
+
+
+READERS = {
+    'csv': _read_csv,
+    'jsonl': _read_jsonl
+}
+
+
+def _get_amount(row: dict) -> int:
+    amount = row.get('amount')
+
+    if isinstance(amount, bool) or not isinstance(amount, (str, int)):
+
+        raise ValidationError(constants.IMPORT_NOT_A_NUMBER_ERROR)
+
+    try:
+        amount = int(amount)
+
+    except ValueError:
+
+        raise ValidationError(constants.IMPORT_AMOUNT_ERROR)
+
+    if amount <= 0:
+
+        raise ValidationError(constants.IMPORT_AMOUNT_ERROR)
+
+    return amount
+
+
+def _apply_row(session, row: dict, default_kind: str | None):
+    if not isinstance(row, dict):
+
+        raise ValidationError('Строка не является объектом')
+
+    kind = row.get('kind') or default_kind
+    name = row.get('dish' if kind == 'report' else 'name')
+
+    if name is not None and not isinstance(name, str):
+
+        raise ValidationError(constants.IMPORT_NAME_ERROR)
+
+    if kind in constants.IMPORT_KINDS:
+        row = {**row, 'amount': _get_amount(row)}
+
+    if kind == 'report':
+        crud.add_report(session, {name: row['amount']}, commit=False)
+
+    elif kind == 'delivery':
+        crud.add_amount(session, row, commit=False)
+
+    elif kind == 'freezer_to_fridge':
+        crud.freezer_to_fridge(session, row, commit=False)
+
+    elif kind == 'fridge_to_freezer':
+        crud.fridge_to_freezer(session, row, commit=False)
+
+    else:
+
+        raise ValidationError(
+            constants.IMPORT_UNKNOWN_KIND_ERROR.format(kind=kind))
+
+    session.flush()
+
+
+def import_file(session,
+                path: Path,
+                kind: str | None = None,
+                file_format: str | None = None,
+                chunk_size: int = constants.IMPORT_DEFAULT_CHUNK_SIZE,
+                on_error: callable = None) -> tuple[int, int]:
+    file_format = file_format or path.suffix.lstrip('.').lower()
+
+    if file_format not in READERS:
+
+        raise ValidationError(
+            constants.IMPORT_FORMAT_ERROR.format(path=path))
+
+    reader = READERS[file_format]
+    done = failed = pending = 0
+
+    with path.open(newline='', encoding='utf-8-sig') as file:
+        for line_num, row in reader(file):
+            try:
+                _apply_row(session, row, kind)
+
+            except (ValidationError, ValueError) as error:
+                failed += 1
+
+                if on_error:
+                    on_error(path, line_num, getattr(error, 'message',
+                                                     str(error)))
+
+                continue
+
+            done += 1
+            pending += 1
+
+            if pending >= chunk_size:
+                session.commit()
+                pending = 0
+
+    session.commit()
+
+    return done, failed
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=constants.IMPORT_DESCRIPTION)
+    parser.add_argument('files', nargs='+', type=Path)
+    parser.add_argument('--kind', choices=constants.IMPORT_KINDS)
+    parser.add_argument('--format',
+                        dest='file_format',
+                        choices=constants.IMPORT_FORMATS)
+    parser.add_argument('--chunk-size',
+                        type=int,
+                        default=constants.IMPORT_DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    def print_error(path, line, message):
+        print(constants.IMPORT_ROW_ERROR.format(path=path,
+                                                line=line,
+                                                message=message),
+              file=sys.stderr)
+
+    create_db()
+    session = SessionLocal()
+    total_done = total_failed = 0
+
+    try:
+        for path in args.files:
+            done, failed = import_file(session,
+                                       path,
+                                       kind=args.kind,
+                                       file_format=args.file_format,
+                                       chunk_size=max(args.chunk_size, 1),
+                                       on_error=print_error)
+            total_done += done
+            total_failed += failed
+
+    except ValidationError as error:
+        parser.error(error.message)
+
+    finally:
+        session.close()
+
+    print(constants.IMPORT_SUMMARY.format(done=total_done,
+                                          failed=total_failed))
+
+    return 1 if total_failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,22 +1,30 @@
-from collections import defaultdict
+from functools import partial
 from operator import itemgetter
-from tkinter import Button, Menu, Tk, messagebox, ttk
-from tkinter.constants import BOTH, CENTER, END, N, W, X
+from tkinter import (Button, Menu, StringVar, Tk, Toplevel, messagebox,
+                     simpledialog, ttk)
+from tkinter.constants import BOTH, BOTTOM, CENTER, END, LEFT, W, X
 from tkinter.messagebox import showerror
 
 import constants
-from core.utils import (ScrollableFrame, create_frame,
-                        generate_interface_center_x_y)
-from core.validators import is_num_lt_max
+from core.dialogs import DialogManager
+from core.executor import DBExecutor
+from core.recipe import RecipeGrid
+from core.report import ReportGrid
+from core.search import NamesSnapshot, PrefixIndex, TypeaheadCombobox
+from core.transfer import TransferGrid
+from core.trees import KeysetPager, VirtualTree
+from core.utils import create_frame, generate_interface_center_x_y
+from core.validators import get_validatecommand, is_num_lt_max
 from db.crud import crud
 from db.database import SessionLocal, create_db
 from db.exceptions import ValidationError
+from db.ledger import FREEZER_TO_FRIDGE, FRIDGE_TO_FREEZER
+from db.schemas import Dashboard
 
 
 class Interface:
     def __init__(self, root: Tk) -> None:
         create_db()
-        self.session = SessionLocal()
 
         # root
         self.root = root
@@ -43,6 +51,11 @@ class Interface:
             screen_height,
             constants.CHILD_WINDOW_WIDTH,
             constants.CHILD_WINDOW_HEIGHT)
+        self.dialogs = DialogManager(self.root,
+                                     constants.CHILD_WINDOW_WIDTH,
+                                     constants.CHILD_WINDOW_HEIGHT,
+                                     self.child_win_x,
+                                     self.child_win_y)
 
         # menu
         main_menu = Menu()
@@ -68,90 +81,198 @@ class Interface:
 
         self.root.config(menu=main_menu)
 
+        # search
+        self.search = ''
+        self.search_after_id = None
+        self.search_var = StringVar()
+        self.search_var.trace_add('write', self._on_search_changed)
+        search_frame = ttk.Frame(self.root)
+        ttk.Label(search_frame,
+                  text=constants.SEARCH_LABEL_TEXT).pack(side=LEFT)
+        ttk.Entry(search_frame,
+                  textvariable=self.search_var).pack(side=LEFT,
+                                                     fill=X,
+                                                     expand=True)
+        search_frame.pack(fill=X,
+                          padx=constants.DEFAULT_PADX,
+                          pady=constants.DEFAULT_PADY)
+
         # notebook
-        notebook = ttk.Notebook()
+        self.notebook = notebook = ttk.Notebook()
         notebook.pack(expand=True, fill=BOTH)
 
         self.types = ttk.Frame(notebook)
         self.total = ttk.Frame(notebook)
+        self.forecast = ttk.Frame(notebook)
         self.fridge = ttk.Frame(notebook)
         self.freezer = ttk.Frame(notebook)
         self.dishes = ttk.Frame(notebook)
+        self.capacity = ttk.Frame(notebook)
+
+        # busy indicator
+        self.busy_bar = ttk.Progressbar(self.root, mode=constants.BUSY_MODE)
 
         # pack frames & add them to notebook
+        self.frame_names = {}
+
         for text, frame in constants.MAIN_FRAMES.items():
             obj = getattr(self, frame)
             obj.pack(fill=BOTH, expand=True)
             notebook.add(obj, text=text)
+            self.frame_names[str(obj)] = frame
 
         # styling
         style = ttk.Style()
         style.theme_use(constants.MAIN_THEME)
 
+        # background DB worker
+        self.dashboard = Dashboard(types=(),
+                                   amounts=(),
+                                   dishes=(),
+                                   dishes_generation=-1)
+        self.type_index = PrefixIndex()
+        self.dish_names = NamesSnapshot(generation=-1, index=PrefixIndex())
+        self.executor = DBExecutor(self.root,
+                                   SessionLocal,
+                                   poll_interval=constants.DB_POLL_INTERVAL,
+                                   on_busy=self._set_busy)
+
         # list data from DB
+        self.dirty = set()
+        self._create_trees()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         self._list_all()
 
     def run(self):
         self.root.mainloop()
 
     def shutdown(self):
-        self.session.close()
+        self.executor.shutdown()
         self.root.destroy()
 
-    def _list_data(self,
-                   data: list[tuple],
-                   columns: tuple[str],
-                   parent: callable) -> None:
+    def _set_busy(self, busy: bool) -> None:
+        if busy:
+            self.root.config(cursor=constants.BUSY_CURSOR)
+            self.busy_bar.pack(side=BOTTOM, fill=X, before=self.notebook)
+            self.busy_bar.start()
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+            self.root.config(cursor='')
+
+    def _show_error(self, error: Exception) -> None:
+        if isinstance(error, ValidationError):
+            showerror(constants.ERROR_TITLE, error.message)
+        else:
+            self.root.report_callback_exception(type(error),
+                                                error,
+                                                error.__traceback__)
+
+    def _submit(self, func: callable, *args, callback: callable = None):
+        self.executor.submit(func,
+                             *args,
+                             callback=callback or self._on_saved,
+                             errback=self._show_error)
+
+    def _on_saved(self, result=None) -> None:
+        self._list_all()
+
+    def _on_report_saved(self, used_amount: dict) -> None:
+        if used_amount:
+            title = constants.REPORT_MSGBOX_SUCCESS_TITLE
+            message = [constants.REPORT_MSGBOX_SUCCESS_MESSAGE.format(
+                name=name,
+                amount=amount,
+                amount_kg=amount / 1000)
+                for name, amount
+                in used_amount.items()
+            ]
+        else:
+            title = constants.REPORT_MSGBOX_EMPTY_TITLE
+            message = constants.REPORT_MSGBOX_EMPTY_MESSAGE
+
+        messagebox.showinfo(title, message)
+        self._list_all()
+
+    def _create_tree(self,
+                     frame: str,
+                     columns: tuple[str],
+                     format_row: callable = None) -> ttk.Treeview:
         labels = itemgetter(*columns)(constants.DATA_COLUMNS_LABELS)
 
-        tree = ttk.Treeview(parent,
-                            columns=columns,
-                            show=constants.HEADINGS)
+        view = VirtualTree(getattr(self, frame),
+                           columns=columns,
+                           buffer=constants.TREE_BUFFER_ROWS,
+                           row_height=constants.TREE_ROW_HEIGHT,
+                           format_row=format_row or (
+                               self._add_kg_column
+                               if constants.AMOUNT_KG in columns
+                               else None),
+                           show=constants.HEADINGS)
+        tree = view.tree
         if isinstance(labels, str):
             tree.heading(0, text=labels, anchor=W)
         else:
             for i in range(len(labels)):
                 tree.heading(i, text=labels[i], anchor=W)
 
-        tree.pack(fill=BOTH, expand=True)
-
-        for row in data:
-            values = ([*row, row[1] / 1000]
-                      if not isinstance(labels, str) and constants.AMOUNT_KG
-                      in columns
-                      else [*row])
-            tree.insert('', END, values=values)
+        view.pack(fill=BOTH, expand=True)
+        self.views[frame] = view
+        self.pagers[frame] = KeysetPager(view,
+                                         partial(self._fetch_page, frame),
+                                         constants.PAGE_SIZE)
 
         return tree
 
-    def _list_types(self) -> None:
-        data = crud.get_types(self.session)
-        columns = constants.LIST_COLUMNS['types']
-        self.types_tree = self._list_data(data, columns, self.types)
+    @staticmethod
+    def _add_kg_column(row: tuple) -> tuple:
+
+        return (*row, row[1] / 1000)
+
+    @staticmethod
+    def _format_forecast_row(row: tuple) -> tuple:
+
+        return tuple('' if value is None else value for value in row)
+
+    def _create_trees(self) -> None:
+        self.views = {}
+        self.pagers = {}
+
+        self.types_tree = self._create_tree('types',
+                                            constants.LIST_COLUMNS['types'])
         self.types_tree.bind(
             constants.RIGHT_MOUSE_BUTTON,
             lambda event: self._types_popup_menu(event, self.types_tree))
 
-    def _list_dishes(self) -> None:
-        data = crud.get_dishes(self.session)
-        columns = constants.LIST_COLUMNS['dishes']
-        self.dishes_tree = self._list_data(data, columns, self.dishes)
+        self.dishes_tree = self._create_tree('dishes',
+                                             constants.LIST_COLUMNS['dishes'])
         self.dishes_tree.bind(
             constants.RIGHT_MOUSE_BUTTON,
             lambda event: self._dishes_popup_menu(event, self.dishes_tree))
 
-    def _list_total(self) -> None:
-        data = crud.get_total(self.session)
-        columns = constants.LIST_COLUMNS['meat']
-        self.total_tree = self._list_data(data, columns, self.total)
+        self.capacity_tree = self._create_tree(
+            'capacity',
+            constants.LIST_COLUMNS['capacity'])
+        self.capacity_tree.bind(
+            constants.RIGHT_MOUSE_BUTTON,
+            lambda event: self._dishes_popup_menu(event, self.capacity_tree))
+
+        self.total_tree = self._create_tree('total',
+                                            constants.LIST_COLUMNS['meat'])
         self.total_tree.bind(
             constants.RIGHT_MOUSE_BUTTON,
             lambda event: self._meat_popup_menu(event, self.total_tree))
 
-    def _list_fridge(self) -> None:
-        data = crud.get_fridge(self.session)
-        columns = constants.LIST_COLUMNS['meat']
-        self.fridge_tree = self._list_data(data, columns, self.fridge)
+        self.forecast_tree = self._create_tree(
+            'forecast',
+            constants.LIST_COLUMNS['forecast'],
+            format_row=self._format_forecast_row)
+        self.forecast_tree.bind(
+            constants.RIGHT_MOUSE_BUTTON,
+            lambda event: self._meat_popup_menu(event, self.forecast_tree))
+
+        self.fridge_tree = self._create_tree('fridge',
+                                             constants.LIST_COLUMNS['meat'])
         self.fridge_tree.bind(
             '<Double-1>',
             lambda event: self._on_double_click(event,
@@ -161,10 +282,8 @@ class Interface:
             constants.RIGHT_MOUSE_BUTTON,
             lambda event: self._meat_popup_menu(event, self.fridge_tree))
 
-    def _list_freezer(self) -> None:
-        data = crud.get_freezer(self.session)
-        columns = constants.LIST_COLUMNS['meat']
-        self.freezer_tree = self._list_data(data, columns, self.freezer)
+        self.freezer_tree = self._create_tree('freezer',
+                                              constants.LIST_COLUMNS['meat'])
         self.freezer_tree.bind(
             '<Double-1>',
             lambda event: self._on_double_click(event,
@@ -175,20 +294,74 @@ class Interface:
             lambda event: self._meat_popup_menu(event, self.freezer_tree))
 
     def _list_all(self) -> None:
-        self._list_types()
-        self._list_dishes()
-        self._list_total()
-        self._list_fridge()
-        self._list_freezer()
-
-    def _update_all_trees(self) -> None:
-        self.types_tree.destroy()
-        self.dishes_tree.destroy()
-        self.fridge_tree.destroy()
-        self.freezer_tree.destroy()
-        self.total_tree.destroy()
+        self.executor.submit(crud.get_dashboard,
+                             self.dashboard,
+                             callback=self._render_dashboard,
+                             errback=self._show_error)
 
-        self._list_all()
+    def _render_dashboard(self, dashboard: Dashboard) -> None:
+        self.dashboard = dashboard
+        self.type_index = PrefixIndex(dashboard.types)
+
+        if dashboard.dishes_generation != self.dish_names.generation:
+            self.dish_names = NamesSnapshot(
+                generation=dashboard.dishes_generation,
+                index=PrefixIndex(dashboard.get_dishes_names()))
+
+        self._mark_dirty()
+
+    def _current_frame(self) -> str | None:
+
+        return self.frame_names.get(self.notebook.select())
+
+    def _mark_dirty(self) -> None:
+        current = self._current_frame()
+        self.dirty = set(self.views)
+
+        for frame, pager in self.pagers.items():
+            if frame != current:
+                pager.detach()
+
+        if current:
+            self._refresh_frame(current)
+
+    def _refresh_frame(self, frame: str) -> None:
+        self.dirty.discard(frame)
+
+        if self.search:
+            self.pagers[frame].reset(self.search)
+        else:
+            self.pagers[frame].detach()
+            self.views[frame].set_rows(self.dashboard.get_rows(frame))
+
+    def _on_tab_changed(self, event) -> None:
+        if (frame := self._current_frame()) in self.dirty:
+            self._refresh_frame(frame)
+
+    def _fetch_page(self,
+                    frame: str,
+                    after: str | None,
+                    limit: int,
+                    search: str,
+                    callback: callable) -> None:
+        self.executor.submit(getattr(crud, f'get_{frame}_page'),
+                             after,
+                             limit,
+                             search,
+                             callback=callback,
+                             errback=self._show_error)
+
+    def _on_search_changed(self, *args) -> None:
+        if self.search_after_id:
+            self.root.after_cancel(self.search_after_id)
+
+        self.search_after_id = self.root.after(constants.SEARCH_DELAY,
+                                               self._apply_search)
+
+    def _apply_search(self) -> None:
+        self.search_after_id = None
+        self.search = self.search_var.get().strip()
+        self._mark_dirty()
 
     def _on_double_click(self, event, tree, db_row_name):
         region = tree.identify_region(event.x, event.y)
@@ -204,14 +377,14 @@ class Interface:
             entry_edit = ttk.Entry(tree,
                                    width=column_box[2],
                                    validate=constants.KEY,
-                                   validatecommand=(tree.register(
-                                       lambda val: is_num_lt_max(
-                                           val,
-                                           constants.MAX_AMOUNT)),
-                                       '%P'))
+                                   validatecommand=get_validatecommand(
+                                       tree,
+                                       is_num_lt_max,
+                                       constants.MAX_AMOUNT))
 
             entry_edit.name = selected_text[0]
             entry_edit.db_row_name = db_row_name
+            entry_edit.expected = selected_text[1]
 
             entry_edit.insert(0, selected_text[1])
             entry_edit.select_range(0, END)
@@ -234,24 +407,12 @@ class Interface:
         amount = event.widget.get()
         name = event.widget.name
 
-        try:
-            crud.update_amount(self.session,
-                               {'name': name,
-                                'amount': amount,
-                                'db_row_name': event.widget.db_row_name})
-
-            self.freezer_tree.destroy()
-            self.fridge_tree.destroy()
-            self.total_tree.destroy()
-            self._list_freezer()
-            self._list_fridge()
-            self._list_total()
-
-        except ValidationError as error:
-            showerror(constants.ERROR_TITLE, error.message)
-
-        finally:
-            event.widget.destroy()
+        self._submit(crud.update_amount,
+                     {'name': name,
+                      'amount': amount,
+                      'db_row_name': event.widget.db_row_name,
+                      'expected': event.widget.expected})
+        event.widget.destroy()
 
     def _meat_popup_menu(self, event, tree: ttk.Treeview):
         row_id = tree.identify_row(event.y)
@@ -273,6 +434,8 @@ class Interface:
                          command=self._open_dish_adding_window)
         menu.add_command(label=constants.CHANGE_DISH_MENU_LABEL,
                          command=self._open_dish_change_window)
+        menu.add_command(label=constants.EDIT_RECIPE_MENU_LABEL,
+                         command=self._open_recipe_window)
         menu.add_separator()
         menu.add_command(label=constants.DELETE_DISH_MENU_LABEL,
                          command=self._open_delete_dish_window)
@@ -291,28 +454,20 @@ class Interface:
         menu.post(event.x_root, event.y_root)
 
     def _open_type_adding_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.ADD_TYPE_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('type_adding',
+                          constants.ADD_TYPE_MENU_LABEL,
+                          self._build_type_adding_window)
 
+    def _build_type_adding_window(self, adding_window: Toplevel):
         def send_data_and_update():
             type_name = type_entry.get()
 
-            try:
-                crud.add_type(self.session, type_name)
-                self.types_tree.destroy()
-                self._list_types()
+            self._submit(crud.add_type, type_name)
+            self.dialogs.close(adding_window)
 
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
+        def reset():
+            type_entry.delete(0, END)
+            type_entry.focus()
 
         type_frame = create_frame(adding_window,
                                   constants.TYPES_FRAME_ENTRY_TEXT)
@@ -329,71 +484,30 @@ class Interface:
                                      command=send_data_and_update)
         adding_window.bind('<Return>', lambda event: send_data_and_update())
         add_type_button.pack(anchor=CENTER)
-        adding_window.focus_force()
+
+        return reset
 
     def _open_dish_adding_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.ADD_DISH_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('dish_adding',
+                          constants.ADD_DISH_MENU_LABEL,
+                          self._build_dish_adding_window)
 
+    def _build_dish_adding_window(self, adding_window: Toplevel):
         def send_data_and_update():
             type_name = type_combobox.get()
             count_per_one = amount_spinbox.get()
             dish_name = dish_name_entry.get()
 
-            try:
-                crud.add_dish(self.session, {'name': type_name,
-                                             'count_per_one': count_per_one,
-                                             'dish_name': dish_name})
-                self.dishes_tree.destroy()
-                self._list_dishes()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
-
-        def _create_amount_frame(event):
-            nonlocal amount_spinbox
-            nonlocal amount_frame
-            nonlocal dish_name_frame
-            nonlocal dish_name_entry
-            nonlocal add_dish_button
-
-            if amount_frame:
-                amount_frame.destroy()
-
-            if dish_name_frame:
-                dish_name_frame.destroy()
-
-            if add_dish_button:
-                add_dish_button.destroy()
-
-            amount_frame = create_frame(adding_window,
-                                        constants.AMOUNT_FRAME_ENTRY_TEXT)
-            dish_name_frame = create_frame(adding_window,
-                                           constants.DISHES_FRAME_ENTRY_TEXT)
-            amount_spinbox = ttk.Spinbox(amount_frame,
-                                         from_=1,
-                                         to=500,
-                                         increment=1,
-                                         validate=constants.KEY,
-                                         validatecommand=(
-                                             amount_frame.register(
-                                                 lambda val: is_num_lt_max(
-                                                     val,
-                                                     constants.DISH_MAX_AMOUNT
-                                                 )),
-                                             '%P'))
-            amount_spinbox.pack(anchor=CENTER, fill=X)
-            dish_name_entry = ttk.Entry(dish_name_frame)
-            dish_name_entry.pack(anchor=CENTER, fill=X)
+            self._submit(crud.add_dish, {'name': type_name,
+                                         'count_per_one': count_per_one,
+                                         'dish_name': dish_name})
+            self.dialogs.close(adding_window)
+
+        def _show_amount_frame(event):
+            if amount_frame.winfo_manager():
+
+                return
+
             amount_frame.pack(anchor=CENTER,
                               fill=X,
                               padx=constants.DEFAULT_PADX,
@@ -402,145 +516,219 @@ class Interface:
                                  fill=X,
                                  padx=constants.DEFAULT_PADX,
                                  pady=constants.DEFAULT_PADY)
-
-            add_dish_button = ttk.Button(adding_window,
-                                         text=constants.ADD_BUTTON_TEXT,
-                                         cursor=constants.BTN_DEFAULT_CUR,
-                                         command=send_data_and_update)
+            add_dish_button.pack(anchor=CENTER)
             adding_window.bind('<Return>',
                                lambda event: send_data_and_update())
-            add_dish_button.pack(anchor=CENTER)
 
-        amount_frame = None
-        dish_name_frame = None
-        amount_spinbox = None
-        add_dish_button = None
-        dish_name_entry = None
+        def reset():
+            for widget in (amount_frame, dish_name_frame, add_dish_button):
+                widget.pack_forget()
+
+            adding_window.unbind('<Return>')
+            amount_spinbox.delete(0, END)
+            dish_name_entry.delete(0, END)
+            type_combobox.set('')
+            type_combobox.set_index(self.type_index)
+            type_combobox.focus()
 
         type_frame = create_frame(adding_window,
                                   constants.CHOOSE_TYPE_FRAME_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_types_names(self.session),
-                                     state=constants.READONLY)
+        type_combobox = TypeaheadCombobox(type_frame,
+                                          self.type_index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
         type_combobox.pack(anchor=CENTER, fill=X)
         type_frame.pack(anchor=CENTER,
                         fill=X,
                         padx=constants.DEFAULT_PADX,
                         pady=constants.DEFAULT_PADY)
-        type_combobox.bind(constants.COMBOBOX_SELECTED, _create_amount_frame)
+        type_combobox.bind(constants.COMBOBOX_SELECTED, _show_amount_frame)
 
-        adding_window.focus_force()
+        amount_frame = create_frame(adding_window,
+                                    constants.AMOUNT_FRAME_ENTRY_TEXT)
+        dish_name_frame = create_frame(adding_window,
+                                       constants.DISHES_FRAME_ENTRY_TEXT)
+        amount_spinbox = ttk.Spinbox(amount_frame,
+                                     from_=1,
+                                     to=500,
+                                     increment=1,
+                                     validate=constants.KEY,
+                                     validatecommand=get_validatecommand(
+                                         amount_frame,
+                                         is_num_lt_max,
+                                         constants.DISH_MAX_AMOUNT))
+        amount_spinbox.pack(anchor=CENTER, fill=X)
+        dish_name_entry = ttk.Entry(dish_name_frame)
+        dish_name_entry.pack(anchor=CENTER, fill=X)
+
+        add_dish_button = ttk.Button(adding_window,
+                                     text=constants.ADD_BUTTON_TEXT,
+                                     cursor=constants.BTN_DEFAULT_CUR,
+                                     command=send_data_and_update)
+
+        return reset
 
     def _open_dish_change_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.CHANGE_DISH_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('dish_change',
+                          constants.CHANGE_DISH_MENU_LABEL,
+                          self._build_dish_change_window)
 
+    def _build_dish_change_window(self, adding_window: Toplevel):
         def send_data_and_update():
             dish_name = type_combobox.get()
             count_per_one = amount_spinbox.get()
 
-            try:
-                crud.update_dish(self.session, {'name': dish_name,
-                                                'count_per_one':
-                                                    count_per_one})
-                self.dishes_tree.destroy()
-                self._list_dishes()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
+            self._submit(crud.update_dish, {'name': dish_name,
+                                            'count_per_one': count_per_one})
+            self.dialogs.close(adding_window)
 
-        def _create_amount_frame(event):
-            nonlocal amount_spinbox
-            nonlocal amount_frame
-            nonlocal apply_change_button
+        def _show_amount_frame(event):
+            if amount_frame.winfo_manager():
 
-            if amount_frame:
-                amount_frame.destroy()
+                return
 
-            if apply_change_button:
-                apply_change_button.destroy()
-
-            amount_frame = create_frame(adding_window,
-                                        constants.AMOUNT_FRAME_ENTRY_TEXT)
-            amount_spinbox = ttk.Spinbox(amount_frame,
-                                         from_=1,
-                                         to=500)
-            amount_spinbox.pack(anchor=CENTER, fill=X)
             amount_frame.pack(anchor=CENTER,
                               fill=X,
                               padx=constants.DEFAULT_PADX,
                               pady=constants.DEFAULT_PADY)
-
-            apply_change_button = ttk.Button(adding_window,
-                                             text=constants.CHANGE_BUTTON_TEXT,
-                                             cursor=constants.BTN_DEFAULT_CUR,
-                                             command=send_data_and_update)
+            apply_change_button.pack(anchor=CENTER)
             adding_window.bind('<Return>',
                                lambda event: send_data_and_update())
-            apply_change_button.pack(anchor=CENTER)
 
-        amount_spinbox = None
-        amount_frame = None
-        apply_change_button = None
+        def reset():
+            amount_frame.pack_forget()
+            apply_change_button.pack_forget()
+            adding_window.unbind('<Return>')
+            amount_spinbox.delete(0, END)
+            type_combobox.set('')
+            type_combobox.set_index(self.dish_names.index)
+            type_combobox.focus()
 
         type_frame = create_frame(adding_window,
                                   constants.CHOOSE_DISH_FRAME_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_dishes_names(
-                                         self.session),
-                                     state=constants.READONLY)
+        type_combobox = TypeaheadCombobox(type_frame,
+                                          self.dish_names.index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
         type_combobox.pack(anchor=CENTER, fill=X)
         type_frame.pack(anchor=CENTER,
                         fill=X,
                         padx=constants.DEFAULT_PADX,
                         pady=constants.DEFAULT_PADY)
-        type_combobox.bind(constants.COMBOBOX_SELECTED, _create_amount_frame)
-        adding_window.focus_force()
+        type_combobox.bind(constants.COMBOBOX_SELECTED, _show_amount_frame)
+
+        amount_frame = create_frame(adding_window,
+                                    constants.AMOUNT_FRAME_ENTRY_TEXT)
+        amount_spinbox = ttk.Spinbox(amount_frame,
+                                     from_=1,
+                                     to=500)
+        amount_spinbox.pack(anchor=CENTER, fill=X)
+
+        apply_change_button = ttk.Button(adding_window,
+                                         text=constants.CHANGE_BUTTON_TEXT,
+                                         cursor=constants.BTN_DEFAULT_CUR,
+                                         command=send_data_and_update)
+
+        return reset
+
+    def _open_recipe_window(self):
+        self.dialogs.open('recipe',
+                          constants.EDIT_RECIPE_MENU_LABEL,
+                          self._build_recipe_window)
+
+    def _build_recipe_window(self, adding_window: Toplevel):
+        recipe_grid = RecipeGrid(adding_window,
+                                 self.type_index,
+                                 limit=constants.TYPEAHEAD_LIMIT)
+
+        def _load_recipe(event):
+            self.executor.submit(crud.get_recipe,
+                                 dish_combobox.get(),
+                                 callback=on_recipe_loaded,
+                                 errback=self._show_error)
+
+        def on_recipe_loaded(lines):
+            recipe_grid.reset(self.type_index,
+                              [(type_name, str(amount))
+                               for type_name, amount in lines])
+
+        def click_send_button():
+            recipe_grid.add_entry_line()
+
+            if errors := recipe_grid.validate(self.type_index):
+                showerror(constants.ERROR_TITLE,
+                          constants.REPORT_INVALID_LINES_MESSAGE.format(
+                              count=errors))
+                adding_window.focus_force()
+
+                return
+
+            self._submit(crud.set_recipe,
+                         dish_combobox.get(),
+                         recipe_grid.get_data(),
+                         callback=on_recipe_saved)
+
+        def on_recipe_saved(result=None):
+            self.dialogs.close(adding_window)
+            self._list_all()
+
+        def reset():
+            dish_combobox.set('')
+            dish_combobox.set_index(self.dish_names.index)
+            dish_combobox.focus()
+            recipe_grid.reset(self.type_index)
+
+        dish_frame = create_frame(adding_window,
+                                  constants.CHOOSE_DISH_FRAME_TEXT)
+        dish_combobox = TypeaheadCombobox(dish_frame,
+                                          self.dish_names.index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
+        dish_combobox.pack(anchor=CENTER, fill=X)
+        dish_frame.pack(anchor=CENTER,
+                        fill=X,
+                        padx=constants.DEFAULT_PADX,
+                        pady=constants.DEFAULT_PADY)
+        dish_combobox.bind(constants.COMBOBOX_SELECTED, _load_recipe)
+
+        recipe_grid.pack(anchor=CENTER,
+                         fill=BOTH,
+                         expand=True,
+                         padx=constants.DEFAULT_PADX,
+                         pady=constants.DEFAULT_PADY)
+
+        ttk.Button(adding_window,
+                   text=constants.SAVE_RECIPE_BUTTON_TEXT,
+                   cursor=constants.BTN_DEFAULT_CUR,
+                   command=click_send_button).pack(anchor=CENTER)
+
+        adding_window.bind('<Control-Return>',
+                           lambda event: click_send_button())
+
+        return reset
 
     def _open_amount_adding_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.ADD_MEAT_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('amount_adding',
+                          constants.ADD_MEAT_MENU_LABEL,
+                          self._build_amount_adding_window)
 
+    def _build_amount_adding_window(self, adding_window: Toplevel):
         def send_data_and_update():
             type_name = type_combobox.get()
             amount = amount_spinbox.get()
 
-            try:
-                crud.add_amount(self.session, {'name': type_name,
-                                               'amount': amount})
-                self.freezer_tree.destroy()
-                self.fridge_tree.destroy()
-                self.total_tree.destroy()
-                self._list_freezer()
-                self._list_fridge()
-                self._list_total()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
+            self._submit(crud.add_amount, {'name': type_name,
+                                           'amount': amount})
+            self.dialogs.close(adding_window)
 
-            finally:
-                adding_window.destroy()
+        def reset():
+            amount_spinbox.delete(0, END)
+            type_combobox.set('')
+            type_combobox.set_index(self.type_index)
+            type_combobox.focus()
 
         type_frame = create_frame(adding_window,
                                   constants.CHOOSE_ADD_TYPE_FRAME_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_types_names(self.session),
-                                     state=constants.READONLY)
+        type_combobox = TypeaheadCombobox(type_frame,
+                                          self.type_index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
         type_combobox.pack(anchor=CENTER, fill=X)
         type_frame.pack(anchor=CENTER,
                         fill=X,
@@ -553,12 +741,10 @@ class Interface:
                                      from_=1,
                                      to=999999,
                                      validate=constants.KEY,
-                                     validatecommand=(
-                                         amount_frame.register(
-                                             lambda val: is_num_lt_max(
-                                                 val,
-                                                 constants.MAX_AMOUNT)),
-                                         '%P'))
+                                     validatecommand=get_validatecommand(
+                                         amount_frame,
+                                         is_num_lt_max,
+                                         constants.MAX_AMOUNT))
         amount_spinbox.pack(anchor=CENTER, fill=X)
         amount_frame.pack(anchor=CENTER,
                           fill=X,
@@ -572,262 +758,140 @@ class Interface:
         add_amount_button.pack(anchor=CENTER)
         adding_window.bind('<Return>',
                            lambda event: send_data_and_update())
-        adding_window.focus_force()
 
-    def _open_freezer_to_fridge_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.FREEZER_TO_FRIDGE_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        return reset
+
+    def _open_transfer_window(self,
+                              direction: str,
+                              title: str,
+                              get_stock: callable,
+                              lines=()):
+        self.dialogs.open(direction,
+                          title,
+                          partial(self._build_transfer_window,
+                                  direction=direction,
+                                  get_stock=get_stock),
+                          lines)
+
+    def _build_transfer_window(self,
+                               adding_window: Toplevel,
+                               direction: str,
+                               get_stock: callable):
+        transfer_grid = TransferGrid(
+            adding_window,
+            self.type_index,
+            lambda name: get_stock(self.dashboard, name),
+            limit=constants.TYPEAHEAD_LIMIT)
 
-        def send_data_and_update():
-            type_name = type_combobox.get()
-            amount = amount_spinbox.get()
+        def click_send_button():
+            transfer_grid.add_entry_line()
 
-            try:
-                crud.freezer_to_fridge(self.session, {'name': type_name,
-                                                      'amount': amount})
-                self.freezer_tree.destroy()
-                self.fridge_tree.destroy()
-                self.total_tree.destroy()
-                self._list_freezer()
-                self._list_fridge()
-                self._list_total()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
-
-        def _is_num_and_less_than_now(val):
-            if not val:
-
-                return True
-
-            try:
-                val = int(val)
-
-            except ValueError:
-
-                return False
-
-            if crud.get_type_freezer(self.session, type_combobox.get()) < val:
-
-                return False
-
-            return True
-
-        def _create_amount_frame(event):
-            nonlocal amount_spinbox
-            nonlocal amount_frame
-            nonlocal to_fridge_button
-
-            if amount_frame:
-                amount_frame.destroy()
-
-            if to_fridge_button:
-                to_fridge_button.destroy()
-
-            type_freezer = crud.get_type_freezer(self.session,
-                                                 type_combobox.get())
-            amount_frame = create_frame(adding_window,
-                                        constants.MOVE_FRAME_ENTRY_TEXT)
-            amount_label = ttk.Label(amount_frame,
-                                     text=((constants.MOVE_FREEZER_LABEL_TEXT
-                                            .format(type_freezer=type_freezer))
-                                           ))
-            amount_spinbox = ttk.Spinbox(amount_frame,
-                                         from_=1,
-                                         to=type_freezer,
-                                         increment=1,
-                                         validate=constants.KEY,
-                                         validatecommand=(
-                                             amount_frame.register(
-                                                 _is_num_and_less_than_now),
-                                             '%P'))
-            amount_spinbox.pack(anchor=CENTER, fill=X)
-            amount_label.pack(anchor=N)
-            amount_frame.pack(anchor=CENTER,
-                              fill=X,
-                              padx=constants.DEFAULT_PADX,
-                              pady=constants.DEFAULT_PADY)
+            if errors := transfer_grid.validate(self.type_index):
+                showerror(constants.ERROR_TITLE,
+                          constants.REPORT_INVALID_LINES_MESSAGE.format(
+                              count=errors))
+                adding_window.focus_force()
 
-            to_fridge_button = ttk.Button(adding_window,
-                                          text=constants.MOVE_BUTTON_TEXT,
-                                          cursor=constants.BTN_DEFAULT_CUR,
-                                          command=send_data_and_update)
-            to_fridge_button.pack(anchor=CENTER)
-            adding_window.bind('<Return>',
-                               lambda event: send_data_and_update())
+                return
 
-        amount_frame = None
-        amount_spinbox = None
-        to_fridge_button = None
+            if transfer_grid.lines:
+                self._submit(crud.transfer_batch,
+                             transfer_grid.get_lines(),
+                             direction,
+                             callback=on_transferred)
 
-        type_frame = create_frame(adding_window,
-                                  constants.MOVE_FRAME_LABEL_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_types_names(self.session),
-                                     state=constants.READONLY)
-        type_combobox.pack(anchor=CENTER, fill=X)
-        type_frame.pack(anchor=CENTER,
-                        fill=X,
-                        padx=constants.DEFAULT_PADX,
-                        pady=constants.DEFAULT_PADY)
-        type_combobox.bind(constants.COMBOBOX_SELECTED, _create_amount_frame)
-        adding_window.focus_force()
+        def on_transferred(results):
+            if not any(result.error for result in results):
+                self.dialogs.close(adding_window)
+                self._list_all()
 
-    def _open_fridge_to_freezer_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.FRIDGE_TO_FREEZER_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+                return
 
-        def send_data_and_update():
-            type_name = type_combobox.get()
-            amount = amount_spinbox.get()
+            errors = transfer_grid.show_results(results)
+            showerror(constants.ERROR_TITLE,
+                      constants.TRANSFER_FAILED_MESSAGE.format(count=errors))
+            adding_window.deiconify()
+            adding_window.focus_force()
+            self._list_all()
 
-            try:
-                crud.fridge_to_freezer(self.session, {'name': type_name,
-                                                      'amount': amount})
-                self.freezer_tree.destroy()
-                self.fridge_tree.destroy()
-                self.total_tree.destroy()
-                self._list_freezer()
-                self._list_fridge()
-                self._list_total()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
-
-        def _is_num_and_less_than_now(val):
-            if not val:
-
-                return True
-
-            try:
-                val = int(val)
-
-            except ValueError:
-
-                return False
-
-            if crud.get_type_fridge(self.session, type_combobox.get()) < val:
-
-                return False
-
-            return True
-
-        def _create_amount_frame(event):
-            nonlocal amount_spinbox
-            nonlocal amount_frame
-            nonlocal to_freezer_button
-
-            if amount_frame:
-                amount_frame.destroy()
-
-            if to_freezer_button:
-                to_freezer_button.destroy()
-
-            type_fridge = crud.get_type_fridge(self.session,
-                                               type_combobox.get())
-            amount_frame = create_frame(adding_window,
-                                        constants.MOVE_FRAME_ENTRY_TEXT)
-            amount_label = ttk.Label(amount_frame,
-                                     text=(constants.MOVE_FRIDGE_LABEL_TEXT
-                                           .format(type_fridge=type_fridge)))
-            amount_spinbox = ttk.Spinbox(amount_frame,
-                                         from_=1,
-                                         to=type_fridge,
-                                         increment=1,
-                                         validate=constants.KEY,
-                                         validatecommand=(
-                                             amount_frame.register(
-                                                 _is_num_and_less_than_now),
-                                             '%P'))
-            amount_spinbox.pack(anchor=CENTER, fill=X)
-            amount_label.pack(anchor=N)
-            amount_frame.pack(anchor=CENTER,
-                              fill=X,
-                              padx=constants.DEFAULT_PADX,
-                              pady=constants.DEFAULT_PADY)
+        def reset(lines=()):
+            transfer_grid.reset(self.type_index, lines)
+            transfer_grid.type_combobox.focus()
 
-            to_freezer_button = ttk.Button(adding_window,
-                                           text=constants.MOVE_BUTTON_TEXT,
-                                           cursor=constants.BTN_DEFAULT_CUR,
-                                           command=send_data_and_update)
-            to_freezer_button.pack(anchor=CENTER)
-            adding_window.bind('<Return>',
-                               lambda event: send_data_and_update())
+        transfer_grid.pack(anchor=CENTER,
+                           fill=BOTH,
+                           expand=True,
+                           padx=constants.DEFAULT_PADX,
+                           pady=constants.DEFAULT_PADY)
 
-        amount_spinbox = None
-        amount_frame = None
-        to_freezer_button = None
+        ttk.Button(adding_window,
+                   text=constants.MOVE_BUTTON_TEXT,
+                   cursor=constants.BTN_DEFAULT_CUR,
+                   command=click_send_button).pack(anchor=CENTER)
 
-        type_frame = create_frame(adding_window,
-                                  constants.MOVE_FRAME_LABEL_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_types_names(self.session),
-                                     state=constants.READONLY)
-        type_combobox.pack(anchor=CENTER, fill=X)
-        type_frame.pack(anchor=CENTER,
-                        fill=X,
-                        padx=constants.DEFAULT_PADX,
-                        pady=constants.DEFAULT_PADY)
-        type_combobox.bind(constants.COMBOBOX_SELECTED, _create_amount_frame)
-        adding_window.focus_force()
+        adding_window.bind('<Control-Return>',
+                           lambda event: click_send_button())
+
+        return reset
+
+    def _open_freezer_to_fridge_window(self):
+        self._open_transfer_window(FREEZER_TO_FRIDGE,
+                                   constants.FREEZER_TO_FRIDGE_MENU_LABEL,
+                                   Dashboard.get_type_freezer)
+
+    def _open_fridge_to_freezer_window(self):
+        self._open_transfer_window(FRIDGE_TO_FREEZER,
+                                   constants.FRIDGE_TO_FREEZER_MENU_LABEL,
+                                   Dashboard.get_type_fridge)
+
+    def _open_thaw_plan_window(self):
+        days = simpledialog.askinteger(constants.THAW_PLAN_MENU_LABEL,
+                                       constants.THAW_PLAN_DAYS_TEXT,
+                                       initialvalue=constants.THAW_PLAN_DAYS,
+                                       minvalue=1,
+                                       maxvalue=constants.THAW_PLAN_MAX_DAYS,
+                                       parent=self.root)
+
+        if days:
+            self.executor.submit(crud.get_thaw_plan,
+                                 days,
+                                 callback=self._on_thaw_plan,
+                                 errback=self._show_error)
+
+    def _on_thaw_plan(self, plan: list) -> None:
+        if not plan:
+            messagebox.showinfo(constants.THAW_PLAN_MENU_LABEL,
+                                constants.THAW_PLAN_EMPTY_MESSAGE)
+
+            return
+
+        self._open_transfer_window(FREEZER_TO_FRIDGE,
+                                   constants.THAW_PLAN_MENU_LABEL,
+                                   Dashboard.get_type_freezer,
+                                   [(line.name, str(line.amount))
+                                    for line in plan])
 
     def _open_report_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.ADD_REPORT_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
-
-        report_frame = ScrollableFrame(adding_window)
-        row = 2
-
-        results = {}
-
-        def _add_combobox_and_spinbox():
-            nonlocal row
-            type_combobox = ttk.Combobox(report_frame.interior,
-                                         values=crud.get_dishes_names(
-                                             self.session),
-                                         state=constants.READONLY)
-            amount_spinbox = ttk.Spinbox(report_frame.interior,
-                                         from_=1,
-                                         to=500,
-                                         increment=1)
-            type_combobox.grid(column=0,
-                               row=row,
-                               padx=constants.DEFAULT_PADX,
-                               pady=constants.DEFAULT_PADY)
-            amount_spinbox.grid(column=1,
-                                row=row,
-                                padx=constants.DEFAULT_PADX,
-                                pady=constants.DEFAULT_PADY)
-
-            row += 1
-
-            results[type_combobox] = amount_spinbox
+        self.dialogs.open('report',
+                          constants.ADD_REPORT_MENU_LABEL,
+                          self._build_report_window)
+
+    def _build_report_window(self, adding_window: Toplevel):
+        report_grid = ReportGrid(adding_window,
+                                 self.dish_names.index,
+                                 limit=constants.TYPEAHEAD_LIMIT)
 
         def click_send_button():
+            report_grid.add_entry_line()
+
+            if errors := report_grid.validate(self.dish_names.index):
+                showerror(constants.ERROR_TITLE,
+                          constants.REPORT_INVALID_LINES_MESSAGE.format(
+                              count=errors))
+                adding_window.focus_force()
+
+                return
+
             result = messagebox.askyesno(
                 title=constants.REPORT_MSGBOX_TITLE,
                 message=constants.REPORT_MSGBOX_MESSAGE,
@@ -840,55 +904,23 @@ class Interface:
                 adding_window.focus_force()
 
         def send_data_and_update():
-            try:
-                data = defaultdict(int)
-                for key, value in results.items():
-                    if key.get() and value.get():
-                        data[key.get()] += int(value.get())
-                used_amount = crud.add_report(self.session, data)
-
-                if used_amount:
-                    title = constants.REPORT_MSGBOX_SUCCESS_TITLE
-                    message = [constants.REPORT_MSGBOX_SUCCESS_MESSAGE.format(
-                        name=name,
-                        amount=amount,
-                        amount_kg=amount / 1000)
-                        for name, amount
-                        in used_amount.items()
-                    ]
-                else:
-                    title = constants.REPORT_MSGBOX_EMPTY_TITLE
-                    message = constants.REPORT_MSGBOX_EMPTY_MESSAGE
-
-                messagebox.showinfo(title, message)
-                self.freezer_tree.destroy()
-                self.fridge_tree.destroy()
-                self.total_tree.destroy()
-                self._list_freezer()
-                self._list_fridge()
-                self._list_total()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
-
-        ttk.Label(report_frame.interior,
-                  text=constants.REPORT_DISH_LABEL).grid(
-            column=0,
-            row=0,
-            padx=constants.DEFAULT_PADX,
-            pady=constants.DEFAULT_PADY
-        )
-        ttk.Label(report_frame.interior,
-                  text=constants.REPORT_DISH_AMOUNT_LABEL).grid(
-            column=1,
-            row=0,
-            padx=constants.DEFAULT_PADX,
-            pady=constants.DEFAULT_PADY
-        )
-        _add_combobox_and_spinbox()
+            self._submit(crud.add_report,
+                         report_grid.get_data(),
+                         callback=on_report_saved)
+
+        def on_report_saved(used_amount):
+            self.dialogs.close(adding_window)
+            self._on_report_saved(used_amount)
+
+        def reset():
+            report_grid.reset(self.dish_names.index)
+            report_grid.dish_combobox.focus()
+
+        report_grid.pack(anchor=CENTER,
+                         fill=BOTH,
+                         expand=True,
+                         padx=constants.DEFAULT_PADX,
+                         pady=constants.DEFAULT_PADY)
 
         Button(adding_window,
                text=constants.SEND_REPORT_BUTTON_TEXT,
@@ -897,45 +929,22 @@ class Interface:
                bg=constants.DANGER_BUTTON_BG,
                fg=constants.DANGER_BUTTON_FG).pack(anchor=CENTER)
 
-        Button(adding_window,
-               text=constants.ADD_ROW_REPORT_BUTTON_TEXT,
-               command=_add_combobox_and_spinbox,
-               cursor=constants.BTN_PLUS_CUR,
-               bg=constants.ADD_ROW_BUTTON_BG,
-               fg=constants.ADD_ROW_BUTTON_FG).pack(anchor=CENTER)
-
         adding_window.bind('<Return>',
                            lambda event: click_send_button())
 
-        report_frame.pack(anchor=CENTER,
-                          fill=X,
-                          padx=constants.DEFAULT_PADX,
-                          pady=constants.DEFAULT_PADY)
-        adding_window.focus_force()
+        return reset
 
     def _open_delete_dish_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.DELETE_DISH_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('delete_dish',
+                          constants.DELETE_DISH_MENU_LABEL,
+                          self._build_delete_dish_window)
 
+    def _build_delete_dish_window(self, adding_window: Toplevel):
         def send_data_and_update():
             dish_name = type_combobox.get()
 
-            try:
-                crud.delete_dish(self.session, dish_name)
-                self.dishes_tree.destroy()
-                self._list_dishes()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
+            self._submit(crud.delete_dish, dish_name)
+            self.dialogs.close(adding_window)
 
         def click_send_button():
             result = messagebox.askyesno(
@@ -949,12 +958,16 @@ class Interface:
                 adding_window.tkraise()
                 adding_window.focus_force()
 
+        def reset():
+            type_combobox.set('')
+            type_combobox.set_index(self.dish_names.index)
+            type_combobox.focus()
+
         type_frame = create_frame(adding_window,
                                   constants.CHOOSE_DELETE_DISH_FRAME_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_dishes_names(
-                                         self.session),
-                                     state=constants.READONLY)
+        type_combobox = TypeaheadCombobox(type_frame,
+                                          self.dish_names.index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
         type_combobox.pack(anchor=CENTER, fill=X)
         type_frame.pack(anchor=CENTER,
                         fill=X,
@@ -971,31 +984,19 @@ class Interface:
         adding_window.bind('<Return>',
                            lambda event: click_send_button())
 
-        adding_window.focus_force()
+        return reset
 
     def _open_delete_type_window(self):
-        adding_window = Tk()
-        adding_window.title(constants.DELETE_TYPE_MENU_LABEL)
-        adding_window.minsize(constants.CHILD_WINDOW_WIDTH,
-                              constants.CHILD_WINDOW_HEIGHT)
-        adding_window.geometry(f'{constants.CHILD_WINDOW_WIDTH}'
-                               f'x{constants.CHILD_WINDOW_HEIGHT}'
-                               f'+{self.child_win_x}'
-                               f'+{self.child_win_y}')
+        self.dialogs.open('delete_type',
+                          constants.DELETE_TYPE_MENU_LABEL,
+                          self._build_delete_type_window)
 
+    def _build_delete_type_window(self, adding_window: Toplevel):
         def send_data_and_update():
             type_name = type_combobox.get()
 
-            try:
-                crud.delete_type(self.session, type_name)
-
-                self._update_all_trees()
-
-            except ValidationError as error:
-                showerror(constants.ERROR_TITLE, error.message)
-
-            finally:
-                adding_window.destroy()
+            self._submit(crud.delete_type, type_name)
+            self.dialogs.close(adding_window)
 
         def click_send_button():
             result = messagebox.askyesno(
@@ -1009,11 +1010,16 @@ class Interface:
                 adding_window.tkraise()
                 adding_window.focus_force()
 
+        def reset():
+            type_combobox.set('')
+            type_combobox.set_index(self.type_index)
+            type_combobox.focus()
+
         type_frame = create_frame(adding_window,
                                   constants.CHOOSE_DELETE_TYPE_FRAME_TEXT)
-        type_combobox = ttk.Combobox(type_frame,
-                                     values=crud.get_types_names(self.session),
-                                     state=constants.READONLY)
+        type_combobox = TypeaheadCombobox(type_frame,
+                                          self.type_index,
+                                          limit=constants.TYPEAHEAD_LIMIT)
         type_combobox.pack(anchor=CENTER, fill=X)
         type_frame.pack(anchor=CENTER,
                         fill=X,
@@ -1029,7 +1035,7 @@ class Interface:
         adding_window.bind('<Return>',
                            lambda event: click_send_button())
 
-        adding_window.focus_force()
+        return reset
 
 
 if __name__ == '__main__':